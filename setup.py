@@ -1,3 +1,27 @@
+import os
+
 from setuptools import setup
 
-setup()
\ No newline at end of file
+# Opt-in: compile the endpoint glue modules with mypyc (requires mypy at build time).
+# pip builds in an isolated environment without mypy, so the build must reuse the
+# current one, e.g. pip install setuptools wheel mypy, then
+# SOUNDCHARTS_MYPYC=1 pip install --no-build-isolation --no-binary soundcharts soundcharts
+# The pure Python modules are used whenever the compiled ones are absent.
+MYPYC_MODULES = ["festival", "mylibrary", "radio", "referential"]
+
+ext_modules = []
+if os.environ.get("SOUNDCHARTS_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError as e:
+        raise RuntimeError(
+            "SOUNDCHARTS_MYPYC=1 requires mypy in the build environment: "
+            "install it and build with pip install --no-build-isolation."
+        ) from e
+
+    ext_modules = mypycify(
+        ["--follow-imports=skip"]
+        + [f"src/soundcharts/{module}.py" for module in MYPYC_MODULES]
+    )
+
+setup(ext_modules=ext_modules)
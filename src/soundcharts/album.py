@@ -3,6 +3,10 @@ from .api_util import (
     request_looper,
     request_wrapper_async,
     request_looper_async,
+    request_looper_iter,
+    request_looper_iter_async,
+    map_concurrent,
+    map_concurrent_async,
 )
 
 
@@ -20,9 +24,22 @@ class Album:
         """
 
         endpoint = f"/api/v2.36/album/by-uuid/{album_uuid}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
+    @staticmethod
+    def get_albums_metadata(album_uuids, max_parallel_requests=None):
+        """
+        Get the metadata of several albums at once, sending the requests concurrently.
+
+        :param album_uuids: A list of album UUIDs.
+        :param max_parallel_requests: Maximum number of requests in flight. Default: the client's parallel_requests.
+        :return: Dictionary mapping each album UUID to its JSON response or an empty dictionary.
+        """
+        return map_concurrent(
+            AlbumAsync.get_album_metadata, album_uuids, max_parallel_requests
+        )
+
     @staticmethod
     def get_album_by_upc(upc):
         """
@@ -33,7 +50,7 @@ class Album:
         """
 
         endpoint = f"/api/v2.36/album/by-upc/{upc}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -47,7 +64,7 @@ class Album:
         """
 
         endpoint = f"/api/v2.36/album/by-platform/{platform}/{identifier}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -132,7 +149,7 @@ class Album:
         """
 
         endpoint = f"/api/v2.26/album/{album_uuid}/tracks"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -144,6 +161,8 @@ class Album:
         limit=100,
         sort_by="position",
         sort_order="asc",
+        max_parallel_requests=None,
+        stream=False,
     ):
         """
         Get current/past chart entries for a specific album.
@@ -155,6 +174,8 @@ class Album:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :param sort_by: Sort criteria. Available values are : position, rankDate. Default: position.
         :param sort_order: Sort order. Available values are : asc, desc. Default: asc
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return a generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Default: False.
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2.26/album/{album_uuid}/charts/ranks/{platform}"
@@ -165,7 +186,13 @@ class Album:
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
-        result = request_looper(endpoint, params)
+        if stream:
+            return request_looper_iter(
+                endpoint, params, max_parallel_requests=max_parallel_requests
+            )
+        result = request_looper(
+            endpoint, params, max_parallel_requests=max_parallel_requests
+        )
         return result if result is not None else {}
 
 
@@ -182,9 +209,22 @@ class AlbumAsync:
         """
 
         endpoint = f"/api/v2.36/album/by-uuid/{album_uuid}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
+    @staticmethod
+    async def get_albums_metadata(album_uuids, max_parallel_requests=None):
+        """
+        Get the metadata of several albums at once, sending the requests concurrently.
+
+        :param album_uuids: A list of album UUIDs.
+        :param max_parallel_requests: Maximum number of requests in flight. Default: the client's parallel_requests.
+        :return: Dictionary mapping each album UUID to its JSON response or an empty dictionary.
+        """
+        return await map_concurrent_async(
+            AlbumAsync.get_album_metadata, album_uuids, max_parallel_requests
+        )
+
     @staticmethod
     async def get_album_by_upc(upc):
         """
@@ -195,7 +235,7 @@ class AlbumAsync:
         """
 
         endpoint = f"/api/v2.36/album/by-upc/{upc}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -209,7 +249,7 @@ class AlbumAsync:
         """
 
         endpoint = f"/api/v2.36/album/by-platform/{platform}/{identifier}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -296,7 +336,7 @@ class AlbumAsync:
         """
 
         endpoint = f"/api/v2.26/album/{album_uuid}/tracks"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -308,6 +348,8 @@ class AlbumAsync:
         limit=100,
         sort_by="position",
         sort_order="asc",
+        max_parallel_requests=None,
+        stream=False,
     ):
         """
         Get current/past chart entries for a specific album.
@@ -319,6 +361,8 @@ class AlbumAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :param sort_by: Sort criteria. Available values are : position, rankDate. Default: position.
         :param sort_order: Sort order. Available values are : asc, desc. Default: asc
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return an async generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Default: False.
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2.26/album/{album_uuid}/charts/ranks/{platform}"
@@ -329,5 +373,11 @@ class AlbumAsync:
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
-        result = await request_looper_async(endpoint, params)
+        if stream:
+            return request_looper_iter_async(
+                endpoint, params, max_parallel_requests=max_parallel_requests
+            )
+        result = await request_looper_async(
+            endpoint, params, max_parallel_requests=max_parallel_requests
+        )
         return result if result is not None else {}
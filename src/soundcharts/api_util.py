@@ -1,12 +1,55 @@
 import asyncio
 import aiohttp
+import atexit
+import contextlib
+import copy
+import functools
+import hashlib
 import json
 import logging
-from requests.structures import CaseInsensitiveDict
+import logging.handlers
+import os
+import queue
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+import concurrent.futures
 from http import HTTPStatus
-from datetime import datetime
+from operator import itemgetter
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlencode
 
+try:
+    # Optional, several times faster than the standard library on large payloads
+    import orjson
+    from orjson import loads as _json_loads
+except ImportError:
+    orjson = None
+    try:
+        # Same dict/list output, also much faster than the standard library
+        from msgspec.json import Decoder
+
+        _json_loads = Decoder().decode
+    except ImportError:
+        from json import loads as _json_loads
+
+
+def _json_dumps(obj):
+    """
+    Serialize a request body to UTF-8 JSON bytes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. non-str keys, which the standard library converts
+            pass
+    return json.dumps(obj).encode()
+
+
 # Logger setup
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -27,15 +70,359 @@ log_file_handler.setFormatter(
     logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
 )
 
+# Once setup() has run, records are handed to a queue and formatted and written to
+# the console and log file by a background thread, so requests never wait on
+# logging I/O. Only the message arguments are merged on the calling thread.
+_log_listener = None
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting, tracebacks included, to the listener.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+    A ``ttl`` or ``maxsize`` of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self, predicate=None):
+        """
+        Drop every entry, or only those whose key matches ``predicate``.
+        """
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+                return
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    Persistent cache backed by a SQLite file, shared across runs. Entries expire
+    after ``ttl`` seconds and values are stored as JSON.
+    """
+
+    def __init__(self, directory, ttl):
+        os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(directory, "responses.sqlite"), check_same_thread=False
+        )
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, endpoint TEXT, expires_at REAL, value BLOB)"
+            )
+
+    @staticmethod
+    def key(*parts):
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def get(self, key, default=None):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires_at, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[0] <= time.time():
+            return default
+        return _json_loads(row[1])
+
+    def set(self, key, endpoint, value):
+        if self.ttl <= 0:
+            return
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, endpoint, time.time() + self.ttl, _json_dumps(value)),
+            )
+
+    def clear(self, endpoints=None):
+        """
+        Drop every entry, or only those of endpoints starting with one of the
+        ``endpoints`` prefixes, along with the expired ones.
+        """
+        if isinstance(endpoints, str):
+            endpoints = (endpoints,)
+        with self._lock, self._db:
+            if endpoints is None:
+                self._db.execute("DELETE FROM responses")
+                return
+            self._db.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            )
+            for prefix in endpoints:
+                self._db.execute(
+                    "DELETE FROM responses WHERE substr(endpoint, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class AdaptiveLimiter:
+    """
+    Async concurrency limit that adapts to the API's feedback (AIMD).
+    The limit grows additively after successful requests, is multiplied by
+    ``decrease`` when the API throttles (429) or is overloaded (5xx), and every
+    request waits while the API asked us to back off (Retry-After).
+    """
+
+    def __init__(self, max_concurrency, increase=0.5, decrease=0.5):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self.increase = increase
+        self.decrease = decrease
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._condition = None
+
+    async def __aenter__(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self._in_flight < max(1, int(self.limit))
+            )
+            self._in_flight += 1
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self):
+        # +increase per "window" of requests, i.e. increase / limit per request
+        self.limit = min(self.max_concurrency, self.limit + self.increase / self.limit)
+
+    def on_throttle(self, delay=None):
+        self.limit = max(1.0, self.limit * self.decrease)
+        if delay:
+            self.pause(delay)
+
+    def pause(self, delay):
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+
+class RateLimitWindow:
+    """
+    The account's rate limit window, as last reported by the API
+    (x-ratelimit-remaining, x-ratelimit-reset), shared by every request of the
+    process whatever its thread or event loop.
+    Requests are sent freely while the remaining budget covers the pages that
+    paginated calls announced. Otherwise, or once fewer than ``reserve`` requests
+    remain, they are spaced evenly until the window resets, instead of being
+    spent in a burst that ends in 429s. Once the window is exhausted, every
+    request waits for its reset.
+    """
+
+    def __init__(self, reserve=20):
+        self.reserve = reserve
+        self.remaining = None
+        self._reset_at = 0.0
+        # Requests announced by paginated calls and not sent yet
+        self._pending = 0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, remaining, reset):
+        with self._lock:
+            if remaining is not None:
+                self.remaining = remaining
+            if reset is not None:
+                self._reset_at = time.monotonic() + reset
+
+    def announce(self, count):
+        with self._lock:
+            self._pending = max(0, self._pending + count)
+
+    @contextlib.contextmanager
+    def announced(self, count):
+        """
+        Announce ``count`` requests about to be sent. Yields a function to call
+        as each of them is sent, the ones never sent are withdrawn on exit.
+        """
+        unsent = count
+        self.announce(count)
+
+        def sent():
+            nonlocal unsent
+            unsent -= 1
+            self.announce(-1)
+
+        try:
+            yield sent
+        finally:
+            self.announce(-unsent)
+
+    def delay(self):
+        """
+        Seconds to wait before sending the next request, which is booked.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.remaining is None or now >= self._reset_at:
+                # Unknown or expired window
+                return 0.0
+            if self.remaining == 0:
+                return self._reset_at - now
+            pace = self._pending >= self.remaining or self.remaining <= self.reserve
+            self.remaining -= 1
+            if not pace:
+                return 0.0
+            start = max(now, self._next_at)
+            self._next_at = start + (self._reset_at - now) / (self.remaining + 1)
+            return start - now
+
+
+def _backoff_delay(attempt, retry_delay):
+    """
+    Exponential backoff with jitter: retry_delay doubles on every attempt, up to
+    BACKOFF_CAP, plus a random share (up to JITTER) so that concurrent clients
+    don't retry in lockstep.
+    """
+    delay = min(BACKOFF_CAP, retry_delay * 2 ** (attempt - 1))
+    return delay * (1 + random.uniform(0, JITTER))
+
+
+def _rate_limit(headers):
+    """
+    Requests remaining in the current rate limit window, and seconds until it
+    resets (x-ratelimit-remaining, x-ratelimit-reset), None when unknown.
+    """
+    values = []
+    for name in ("x-ratelimit-remaining", "x-ratelimit-reset"):
+        try:
+            values.append(max(0, int(headers.get(name))))
+        except (TypeError, ValueError):
+            values.append(None)
+    return tuple(values)
+
+
+def _retry_after(headers):
+    """
+    Delay in seconds requested by a Retry-After header, if any.
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 # Global config
 HEADERS = None
 BASE_URL = None
+# BASE_URL without its trailing slash, endpoints are appended to it as is
+_URL_PREFIX = ""
 PARALLEL_REQUESTS = 5
 MAX_RETRIES = 5
 RETRY_DELAY = 10
+BACKOFF_CAP = 30
+JITTER = 0.5
 TIMEOUT = 10
+KEEPALIVE_TIMEOUT = 75
 EXCEPTION_LOG_LEVEL = logging.ERROR
 QUOTA_WARNING = [100, 1000, 10000, 100000]
+# Largest page the list endpoints serve: the paginators always request full
+# pages, whatever the limit, to need as few round trips as possible
+MAX_PAGE_SIZE = 100
+# Below this many requests left in the rate limit window, requests are paced
+RATE_LIMIT_RESERVE = 20
+# Offsets are relative to a cursor and can't go past this many items
+CURSOR_BATCH_SIZE = 50000
+
+# Responses of idempotent GET endpoints, for calls made with cache=True
+_RESPONSE_CACHE = TTLCache(maxsize=4096, ttl=3600)
+
+# Validators (ETag, Last-Modified) of cached responses, along with the response:
+# once it expires from the response cache, it is revalidated with a conditional
+# GET and reused as is if the API answers 304 Not Modified
+REVALIDATION_TTL = 86400
+_REVALIDATION_CACHE = TTLCache(maxsize=4096, ttl=REVALIDATION_TTL)
+
+# Responses that can no longer change (e.g. audience over a past period), kept
+# across runs when a cache directory is configured, for calls made with persist=True
+_DISK_CACHE = None
+DISK_CACHE_TTL = 30 * 86400
+
+# Rate limit window of the account, shared by every request
+_RATE_WINDOW = RateLimitWindow(RATE_LIMIT_RESERVE)
+
+# GET requests known to return a 404, so that missing entities aren't requested again
+_NOT_FOUND_CACHE = TTLCache(maxsize=8192, ttl=300)
+
+# Shared HTTP sessions, one per event loop (an aiohttp session is bound to the
+# loop it was created on). Keeping them alive lets consecutive requests reuse
+# pooled keep-alive connections instead of paying a TCP + TLS handshake each.
+_SESSIONS = {}
+# The sync API loop and the caller's own loops can run in different threads
+_SESSIONS_LOCK = threading.Lock()
+_SESSION_GENERATION = 0
+
+# The sync API runs every call, whatever the calling thread, on one persistent
+# event loop owned by a background thread, so that its session (and connection
+# pool) is shared and survives from one call to the next.
+_SYNC_LOOP = None
+_SYNC_THREAD = None
+_SYNC_LOOP_LOCK = threading.Lock()
 
 
 def setup(
@@ -49,29 +436,268 @@ def setup(
     console_log_level=logging.WARNING,
     file_log_level=logging.WARNING,
     exception_log_level=logging.ERROR,
+    cache_ttl=3600,
+    cache_size=4096,
+    backoff_cap=30,
+    jitter=0.5,
+    not_found_ttl=300,
+    cache_dir=None,
 ):
     global HEADERS, BASE_URL, PARALLEL_REQUESTS, MAX_RETRIES, RETRY_DELAY, TIMEOUT, EXCEPTION_LOG_LEVEL
+    global BACKOFF_CAP, JITTER, _URL_PREFIX
+    global _log_listener
+    global _SESSION_GENERATION, _RESPONSE_CACHE, _NOT_FOUND_CACHE, _DISK_CACHE
+    global _REVALIDATION_CACHE, _RATE_WINDOW
 
-    HEADERS = CaseInsensitiveDict()
-    HEADERS["x-app-id"] = app_id
-    HEADERS["x-api-key"] = api_key
+    HEADERS = {"x-app-id": app_id, "x-api-key": api_key}
 
     BASE_URL = base_url
+    _URL_PREFIX = base_url.rstrip("/")
     PARALLEL_REQUESTS = parallel_requests
     MAX_RETRIES = max_retries
     RETRY_DELAY = retry_delay
+    BACKOFF_CAP = backoff_cap
+    JITTER = jitter
     TIMEOUT = timeout
     EXCEPTION_LOG_LEVEL = exception_log_level
 
+    # Sessions opened with the previous credentials are replaced on next use
+    _SESSION_GENERATION += 1
+
+    # The rate limit window is the account's
+    _RATE_WINDOW = RateLimitWindow(RATE_LIMIT_RESERVE)
+
+    # Cached responses may not be visible with the new credentials
+    _RESPONSE_CACHE = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+    _REVALIDATION_CACHE = TTLCache(
+        maxsize=cache_size, ttl=REVALIDATION_TTL if cache_ttl > 0 else 0
+    )
+    _NOT_FOUND_CACHE = TTLCache(maxsize=8192, ttl=not_found_ttl)
+
+    if cache_dir is None:
+        cache_dir = os.environ.get("SOUNDCHARTS_CACHE_DIR")
+    if _DISK_CACHE is not None:
+        _DISK_CACHE.close()
+    _DISK_CACHE = (
+        DiskCache(os.path.expanduser(cache_dir), DISK_CACHE_TTL) if cache_dir else None
+    )
+
+    stop_log_listener()
     logger.handlers.clear()
+    # Records below every handler's level are dropped before being built
+    logger.setLevel(min(console_log_level, file_log_level))
 
     console_handler.setLevel(console_log_level)
-    logger.addHandler(console_handler)
-
     log_file_handler.setLevel(file_log_level)
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, log_file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+@atexit.register
+def stop_log_listener():
+    """
+    Flush pending log records and stop the background logging thread.
+    Records logged afterwards are written directly by the calling thread.
+    """
+    global _log_listener
+
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    _log_listener = None
+    logger.handlers.clear()
+    logger.addHandler(console_handler)
     logger.addHandler(log_file_handler)
 
 
+async def _session_lifetime(session):
+    """
+    Keep a shared session open until the event loop shuts down.
+    The loop closes pending async generators on shutdown (asyncio.run does it
+    automatically), which runs the finally clause and closes the session.
+    """
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+def _new_connector():
+    # aiohttp speaks HTTP/1.1 only, so concurrency comes from pooled keep-alive
+    # connections: make sure the pool never caps the configured parallelism.
+    # The API host resolves to the same addresses for long periods: keep DNS
+    # answers for 5 minutes rather than aiohttp's default 10 seconds.
+    # (aiohttp already sets TCP_NODELAY on every connection.)
+    # Idle connections are kept for 75 seconds instead of 15, so that calls
+    # spaced out by a caller's own processing still find a warm connection.
+    return aiohttp.TCPConnector(
+        limit=max(100, PARALLEL_REQUESTS),
+        ttl_dns_cache=300,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+
+
+async def _get_session():
+    """
+    Return the shared session of the running event loop, creating it if needed.
+    """
+    loop = asyncio.get_running_loop()
+
+    with _SESSIONS_LOCK:
+        for other_loop in [l for l in _SESSIONS if l.is_closed()]:
+            del _SESSIONS[other_loop]
+        entry = _SESSIONS.get(loop)
+
+    if entry is not None:
+        session, generation, lifetime = entry
+        if not session.closed and generation == _SESSION_GENERATION:
+            return session
+        await lifetime.aclose()
+
+    session = aiohttp.ClientSession(headers=HEADERS, connector=_new_connector())
+    lifetime = _session_lifetime(session)
+    await lifetime.__anext__()
+    with _SESSIONS_LOCK:
+        _SESSIONS[loop] = (session, _SESSION_GENERATION, lifetime)
+    return session
+
+
+async def close_async():
+    """
+    Close the HTTP session shared by async calls on the running event loop.
+    """
+    with _SESSIONS_LOCK:
+        entry = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[2].aclose()
+
+
+def _sync_loop():
+    """
+    Return the event loop of the sync API, starting its thread if needed.
+    """
+    global _SYNC_LOOP, _SYNC_THREAD
+
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="soundcharts-loop", daemon=True
+            )
+            thread.start()
+            _SYNC_LOOP, _SYNC_THREAD = loop, thread
+        return _SYNC_LOOP
+
+
+def _submit(coro):
+    return asyncio.run_coroutine_threadsafe(coro, _sync_loop())
+
+
+@atexit.register
+def close():
+    """
+    Close the HTTP session and event loop used by the sync API, once its calls
+    are done. A new one is opened transparently if the sync API is used again.
+    """
+    global _SYNC_LOOP, _SYNC_THREAD
+
+    with _SYNC_LOOP_LOCK:
+        loop, thread = _SYNC_LOOP, _SYNC_THREAD
+        _SYNC_LOOP = _SYNC_THREAD = None
+    if loop is None:
+        return
+    try:
+        # Closes the session, see _session_lifetime
+        asyncio.run_coroutine_threadsafe(loop.shutdown_asyncgens(), loop).result()
+    except Exception as e:
+        logger.debug("Failed to close the HTTP session: %s", e)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def clear_cache(endpoints=None):
+    """
+    Drop every response cached in memory. The disk cache is left untouched,
+    see clear_disk_cache.
+
+    :param endpoints: Optional endpoint prefix, or tuple of prefixes: only the
+        responses of matching endpoints are dropped.
+    """
+    if endpoints is None:
+        _RESPONSE_CACHE.clear()
+        _REVALIDATION_CACHE.clear()
+    else:
+        _RESPONSE_CACHE.clear(lambda key: key[1].startswith(endpoints))
+        _REVALIDATION_CACHE.clear(lambda key: key[1].startswith(endpoints))
+
+
+def clear_disk_cache(endpoints=None):
+    """
+    Drop the responses persisted in the disk cache, if one is configured.
+
+    :param endpoints: Optional endpoint prefix, or tuple of prefixes: only the
+        responses of matching endpoints are dropped.
+    """
+    if _DISK_CACHE is not None:
+        _DISK_CACHE.clear(endpoints)
+
+
+def clear_not_found_cache():
+    """
+    Forget every request known to return a 404, e.g. once the entities exist.
+    """
+    _NOT_FOUND_CACHE.clear()
+
+
+class PartialFailureError(RuntimeError):
+    """
+    Raised when some of the calls a list of identifiers was split into failed.
+    The other calls were applied: ``succeeded`` and ``failed`` are the indexes of
+    the calls (chunks of mylibrary.MAX_IDS_PER_CALL identifiers, in order), and ``result``
+    is the merged response of the succeeded ones.
+    """
+
+    def __init__(self, message, succeeded, failed, result):
+        super().__init__(message)
+        self.succeeded = succeeded
+        self.failed = failed
+        self.result = result
+
+
+class _FullURL:
+    """
+    URL with its query string, built the first time it is formatted.
+    """
+
+    __slots__ = ("url", "params", "_value")
+
+    def __init__(self, url, params):
+        self.url = url
+        self.params = params
+        self._value = None
+
+    def __str__(self):
+        if self._value is None:
+            self._value = self.url
+            if self.params:
+                self._value += "?" + urlencode(self.params, doseq=True)
+        return self._value
+
+
+def _decode_body(response, raw):
+    return raw.decode(response.get_encoding(), errors="replace")
+
+
+def _cache_key(method_name, endpoint, params):
+    return (method_name, endpoint, urlencode(sorted(params.items()), doseq=True))
+
+
 async def request_wrapper_async(
     endpoint,
     params=None,
@@ -81,11 +707,16 @@ async def request_wrapper_async(
     timeout=None,
     method=None,
     session: aiohttp.ClientSession | None = None,
+    cache=False,
+    limiter: AdaptiveLimiter | None = None,
 ):
     """
     Async HTTP wrapper with retries.
+    With cache=True, successful GET responses are kept for the configured cache TTL,
+    then revalidated with a conditional GET if the API sent an ETag or Last-Modified.
+    A limiter is notified of successes and throttling so that it can adapt.
     """
-    global HEADERS, BASE_URL, MAX_RETRIES, RETRY_DELAY, TIMEOUT
+    global HEADERS, MAX_RETRIES, RETRY_DELAY, TIMEOUT
 
     if max_retries is None:
         max_retries = MAX_RETRIES
@@ -94,8 +725,7 @@ async def request_wrapper_async(
     if timeout is None:
         timeout = TIMEOUT
 
-    url = f"{BASE_URL}{endpoint}"
-    headers = dict(HEADERS or {})
+    url = _URL_PREFIX + endpoint
 
     raw_params = params or {}
     params = {}
@@ -108,9 +738,6 @@ async def request_wrapper_async(
             continue
         params[k] = v
 
-    if body:
-        headers["Content-Type"] = "application/json"
-
     if method is None:
         method_name = "POST" if body else "GET"
     elif method.lower() == "delete":
@@ -118,150 +745,239 @@ async def request_wrapper_async(
     else:
         raise ValueError(f"Unsupported HTTP method: {method}")
 
-    full_url = f"{url}?{urlencode(params, doseq=True)}" if params else url
-
-    owns_session = False
+    # Only needed for log and error messages
+    full_url = _FullURL(url, params)
+
+    cache_key = None
+    stale = None
+    if method_name == "GET":
+        request_key = _cache_key(method_name, endpoint, params)
+        if _NOT_FOUND_CACHE.get(request_key):
+            log_msg = f"404 Not Found (cached): {full_url}"
+            logger.warning(log_msg)
+            if logging.WARNING >= EXCEPTION_LOG_LEVEL:
+                raise RuntimeError(log_msg)
+            return None
+        if cache:
+            cache_key = request_key
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                logger.info("Cache hit: %s %s", method_name, full_url)
+                return copy.deepcopy(cached)
+            # (etag, last_modified, payload) of an expired response
+            stale = _REVALIDATION_CACHE.get(cache_key)
+
+    # The shared session already carries the authentication headers
+    headers = None
     if session is None:
-        timeout_cfg = aiohttp.ClientTimeout(total=timeout)
-        session = aiohttp.ClientSession(timeout=timeout_cfg)
-        owns_session = True
+        session = await _get_session()
+    else:
+        headers = dict(HEADERS or {})
+    # Serialized once, not on every retry
+    data = None
+    if body:
+        data = _json_dumps(body)
+        if headers is None:
+            headers = {"Content-Type": "application/json"}
+        else:
+            headers["Content-Type"] = "application/json"
+    if stale is not None:
+        if headers is None:
+            headers = {}
+        etag, last_modified, _ = stale
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    timeout_cfg = aiohttp.ClientTimeout(total=timeout)
 
     # Otherwise max_retries=0 will result in no attempts
     attempts = max_retries + 1
-    try:
-        for attempt in range(1, attempts + 1):
-            try:
-                logger.info(f"Attempt {attempt}/{attempts}: {method_name} {full_url}")
+    for attempt in range(1, attempts + 1):
+        try:
+            logger.info(
+                "Attempt %s/%s: %s %s", attempt, attempts, method_name, full_url
+            )
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Headers: %s", headers)
                 if params:
                     logger.debug("Params: %s", params)
-                if body:
-                    logger.debug("Body: %s", json.dumps(body))
-
-                async with session.request(
-                    method_name,
-                    url,
-                    params=params,
-                    headers=headers,
-                    data=json.dumps(body) if body else None,
-                ) as response:
-                    status = response.status
-                    text = await response.text()
-
+                if data:
+                    logger.debug("Body: %s", data.decode())
+
+            wait = _RATE_WINDOW.delay()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            async with session.request(
+                method_name,
+                url,
+                params=params,
+                headers=headers,
+                data=data,
+                timeout=timeout_cfg,
+            ) as response:
+                status = response.status
+                # Raw bytes: JSON is parsed from them directly, the body is only
+                # decoded to text when it is logged or reported as an error
+                raw = await response.read()
+
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug("Response Status: %s", status)
-                    logger.debug("Response Body: %s", text)
-
-                    # Remaining requests
-                    quota_raw = response.headers.get("x-quota-remaining")
-                    quota_remaining = None
-                    if quota_raw is not None:
-                        try:
-                            quota_remaining = int(quota_raw)
-                        except ValueError:
-                            quota_remaining = quota_raw
-                    if quota_remaining in QUOTA_WARNING:
-                        logger.warning(f"{quota_remaining} calls remaining.")
-
-                    if status == HTTPStatus.OK:
-                        try:
-                            payload = await response.json()
-                        except Exception:
-                            payload = text
-
-                        if isinstance(payload, dict):
-                            payload.setdefault("quota_remaining", quota_remaining)
-                        return payload
-
-                    # Extract error message
+                    logger.debug("Response Body: %s", _decode_body(response, raw))
+
+                # Remaining requests
+                quota_raw = response.headers.get("x-quota-remaining")
+                quota_remaining = None
+                if quota_raw is not None:
                     try:
-                        error_data = await response.json()
-                        message = (
-                            error_data.get("errors", [{}])[0].get("message")
-                            or error_data.get("message")
-                            or text
-                        )
-                    except Exception:
-                        message = text
+                        quota_remaining = int(quota_raw)
+                    except ValueError:
+                        quota_remaining = quota_raw
+                if quota_remaining in QUOTA_WARNING:
+                    logger.warning(f"{quota_remaining} calls remaining.")
 
-                    # 404
-                    if status == HTTPStatus.NOT_FOUND:
-                        log_msg = f"404 Not Found: {full_url} — {message}"
-                        logger.warning(log_msg)
-                        if logging.WARNING >= EXCEPTION_LOG_LEVEL:
-                            raise RuntimeError(log_msg)
-                        return None
+                retry_after = _retry_after(response.headers)
 
-                    # 5xx
+                _RATE_WINDOW.update(*_rate_limit(response.headers))
+
+                if limiter is not None:
+
+                    if status in (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED):
+                        limiter.on_success()
                     elif status in {
+                        HTTPStatus.TOO_MANY_REQUESTS,
                         HTTPStatus.BAD_GATEWAY,
                         HTTPStatus.SERVICE_UNAVAILABLE,
                         HTTPStatus.GATEWAY_TIMEOUT,
                     }:
+                        limiter.on_throttle(retry_after)
+
+                if status == HTTPStatus.OK:
+                    try:
+                        payload = _json_loads(raw)
+                    except Exception:
+                        payload = _decode_body(response, raw)
+
+                    if isinstance(payload, dict):
+                        payload.setdefault("quota_remaining", quota_remaining)
+                    if cache_key is not None:
+                        cached = copy.deepcopy(payload)
+                        _RESPONSE_CACHE.set(cache_key, cached)
+                        etag = response.headers.get("ETag")
+                        last_modified = response.headers.get("Last-Modified")
+                        if etag or last_modified:
+                            _REVALIDATION_CACHE.set(
+                                cache_key, (etag, last_modified, cached)
+                            )
+                        else:
+                            # The previous validators describe an older body
+                            _REVALIDATION_CACHE.discard(cache_key)
+                    return payload
+
+                if status == HTTPStatus.NOT_MODIFIED and stale is not None:
+                    logger.info("Not modified: %s %s", method_name, full_url)
+                    _RESPONSE_CACHE.set(cache_key, stale[2])
+                    _REVALIDATION_CACHE.set(cache_key, stale)
+                    payload = copy.deepcopy(stale[2])
+                    if isinstance(payload, dict) and quota_remaining is not None:
+                        payload["quota_remaining"] = quota_remaining
+                    return payload
+
+                # Extract error message
+                text = _decode_body(response, raw)
+                try:
+                    error_data = _json_loads(text)
+                    message = (
+                        error_data.get("errors", [{}])[0].get("message")
+                        or error_data.get("message")
+                        or text
+                    )
+                except Exception:
+                    message = text
+
+                # 404
+                if status == HTTPStatus.NOT_FOUND:
+                    if method_name == "GET":
+                        _NOT_FOUND_CACHE.set(request_key, True)
+                    log_msg = f"404 Not Found: {full_url} — {message}"
+                    logger.warning(log_msg)
+                    if logging.WARNING >= EXCEPTION_LOG_LEVEL:
+                        raise RuntimeError(log_msg)
+                    return None
+
+                # 5xx
+                elif status in {
+                    HTTPStatus.BAD_GATEWAY,
+                    HTTPStatus.SERVICE_UNAVAILABLE,
+                    HTTPStatus.GATEWAY_TIMEOUT,
+                }:
+                    if attempt >= attempts:
+                        break
+                    if retry_after is not None:
+                        sleep_delay = retry_after
+                    else:
+                        sleep_delay = _backoff_delay(attempt, retry_delay)
+                    logger.warning(
+                        f"{status} Error: {message} when calling {full_url} — "
+                        f"Retrying in {sleep_delay:.1f} seconds ({attempt}/{attempts})"
+                    )
+                    await asyncio.sleep(sleep_delay)
+
+                # Auth / rate limit
+                elif status in {
+                    HTTPStatus.TOO_MANY_REQUESTS,
+                    HTTPStatus.FORBIDDEN,
+                    HTTPStatus.UNAUTHORIZED,
+                }:
+                    if (
+                        status == HTTPStatus.TOO_MANY_REQUESTS
+                        and "maximum request count" in message
+                    ):
                         if attempt >= attempts:
                             break
+                        reset = response.headers.get("x-ratelimit-reset")
+                        if retry_after is not None:
+                            sleep_delay = retry_after
+                        elif reset and reset.isdigit():
+                            sleep_delay = int(reset) + 1
+                        else:
+                            sleep_delay = _backoff_delay(attempt, retry_delay)
                         logger.warning(
                             f"{status} Error: {message} when calling {full_url} — "
-                            f"Retrying in {retry_delay} seconds ({attempt}/{attempts})"
+                            f"Retrying in {sleep_delay:.1f} seconds ({attempt + 1}/{attempts})"
                         )
-                        await asyncio.sleep(retry_delay)
-
-                    # Auth / rate limit
-                    elif status in {
-                        HTTPStatus.TOO_MANY_REQUESTS,
-                        HTTPStatus.FORBIDDEN,
-                        HTTPStatus.UNAUTHORIZED,
-                    }:
-                        if (
-                            status == HTTPStatus.TOO_MANY_REQUESTS
-                            and "maximum request count" in message
-                        ):
-                            if attempt >= attempts:
-                                break
-                            sleep_delay = (
-                                int(response.headers.get("x-ratelimit-reset", 0)) + 1
-                            )
-                            logger.warning(
-                                f"{status} Error: {message} when calling {full_url} — "
-                                f"Retrying in {sleep_delay} seconds ({attempt + 1}/{attempts})"
-                            )
-                            await asyncio.sleep(sleep_delay)
-                        else:
-                            log_msg = (
-                                f"{status} Error: {message} when calling {full_url}"
-                            )
-                            logger.error(log_msg)
-                            if logging.ERROR >= EXCEPTION_LOG_LEVEL:
-                                raise RuntimeError(log_msg)
-                            return None
-
+                        await asyncio.sleep(sleep_delay)
                     else:
-                        log_msg = (
-                            f"{status} Unknown Error: {message} when calling {full_url}"
-                        )
+                        log_msg = f"{status} Error: {message} when calling {full_url}"
                         logger.error(log_msg)
                         if logging.ERROR >= EXCEPTION_LOG_LEVEL:
-                            raise RuntimeError(f"HTTP {status}: {message}")
-
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                logger.warning(e)
-                if attempt >= attempts:
-                    raise RuntimeError(
-                        f"Maximum retry attempts reached when calling {full_url}."
-                    ) from e
-                await asyncio.sleep(retry_delay)
-
-        final_msg = (
-            f"Unhandled error or maximum retries exceeded when calling {full_url}."
-        )
-        logger.error(final_msg)
-        if logging.ERROR >= EXCEPTION_LOG_LEVEL:
-            raise RuntimeError(final_msg)
+                            raise RuntimeError(log_msg)
+                        return None
 
-        return None
+                else:
+                    log_msg = (
+                        f"{status} Unknown Error: {message} when calling {full_url}"
+                    )
+                    logger.error(log_msg)
+                    if logging.ERROR >= EXCEPTION_LOG_LEVEL:
+                        raise RuntimeError(f"HTTP {status}: {message}")
 
-    finally:
-        if owns_session and session is not None:
-            await session.close()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(e)
+            if attempt >= attempts:
+                raise RuntimeError(
+                    f"Maximum retry attempts reached when calling {full_url}."
+                ) from e
+            await asyncio.sleep(_backoff_delay(attempt, retry_delay))
+
+    final_msg = f"Unhandled error or maximum retries exceeded when calling {full_url}."
+    logger.error(final_msg)
+    if logging.ERROR >= EXCEPTION_LOG_LEVEL:
+        raise RuntimeError(final_msg)
+
+    return None
 
 
 async def request_looper_async(
@@ -270,6 +986,54 @@ async def request_looper_async(
     body=None,
     print_progress=False,
     max_parallel_requests=None,
+    cache=False,
+    persist=False,
+):
+    """
+    Async paginator: fetches every page up to the requested limit and merges their items.
+    With cache=True, the merged result of GET calls is kept for the configured cache TTL.
+    With persist=True, it is also kept in the disk cache if one is configured: only
+    for responses that can no longer change.
+    """
+    cache_key = None
+    if cache and not body:
+        # Distinct from the key of a single page request on the same endpoint
+        cache_key = _cache_key("GET_ALL", endpoint, params or {})
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Cache hit: GET %s (all pages)", endpoint)
+            return copy.deepcopy(cached)
+
+    disk_key = None
+    if persist and not body and _DISK_CACHE is not None:
+        # Responses may depend on the host (e.g. sandbox or production) and account
+        disk_key = DiskCache.key(
+            BASE_URL,
+            (HEADERS or {}).get("x-app-id"),
+            _cache_key("GET_ALL", endpoint, params or {}),
+        )
+        cached = _DISK_CACHE.get(disk_key)
+        if cached is not None:
+            logger.info("Disk cache hit: GET %s (all pages)", endpoint)
+            return cached
+
+    results = await _request_looper_async(
+        endpoint, params, body, print_progress, max_parallel_requests
+    )
+    if results and "items" in results:
+        if cache_key is not None:
+            _RESPONSE_CACHE.set(cache_key, copy.deepcopy(results))
+        if disk_key is not None:
+            _DISK_CACHE.set(disk_key, endpoint, results)
+    return results
+
+
+async def _request_looper_async(
+    endpoint,
+    params=None,
+    body=None,
+    print_progress=False,
+    max_parallel_requests=None,
 ):
     global PARALLEL_REQUESTS
     if max_parallel_requests is None:
@@ -287,120 +1051,114 @@ async def request_looper_async(
 
     # Limit / offset
     raw_limit = params.pop("limit", None)
-    if raw_limit is not None:
-        limit = int(raw_limit)
-        params["limit"] = min(limit, 100)  # page size
-    else:
-        limit = None
+    limit = int(raw_limit) if raw_limit is not None else None
+    page_size = MAX_PAGE_SIZE if limit is None else min(limit, MAX_PAGE_SIZE)
+    params["limit"] = page_size
 
     initial_offset = int(params.get("offset") or 0)
     params["offset"] = max(initial_offset, 0)
-    page_size = params.get("limit", 100)
-
-    timeout_cfg = aiohttp.ClientTimeout(total=TIMEOUT)
-    async with aiohttp.ClientSession(timeout=timeout_cfg) as session:
-        # First page
-        first_params = params.copy()
-        results = await request_wrapper_async(
-            endpoint,
-            first_params,
-            body=body,
-            session=session,
-        )
-
-        if not results or "items" not in results:
-            return results
-
-        items = list(results.get("items", []))
-        fetched_count = len(items)
-        last_quota_remaining = results.get("quota_remaining")
 
-        first_page = results.get("page", {}) or {}
-        total_server = first_page.get("total", len(items))
-        total_effective = (
-            min(total_server, limit) if limit is not None else total_server
-        )
+    # First page
+    first_params = params.copy()
+    results = await request_wrapper_async(
+        endpoint,
+        first_params,
+        body=body,
+    )
 
-        if print_progress:
-            print_percentage(fetched_count, total_effective)
+    if not results or "items" not in results:
+        return results
 
-        # Are we fetching the full dataset or a limited slice?
-        fetched_all = (limit is None) or (limit >= total_server)
+    items = list(results.get("items") or [])
+    fetched_count = len(items)
+    last_quota_remaining = results.get("quota_remaining")
 
-        if fetched_count >= total_effective:
-            if limit is not None:
-                items = items[:limit]
-            results["items"] = items
+    first_page = results.get("page") or {}
+    total_server = first_page.get("total", len(items))
+    total_effective = min(total_server, limit) if limit is not None else total_server
 
-            # pagination from first page (also "last fetched" here)
-            results["page"] = dict(first_page) if first_page else {}
-            results["page"]["total"] = total_server
+    if print_progress:
+        print_percentage(fetched_count, total_effective)
 
-            if fetched_all:
-                results["page"]["next"] = None  # only if we truly fetched all
+    # Are we fetching the full dataset or a limited slice?
+    fetched_all = (limit is None) or (limit >= total_server)
 
-            return results
+    if fetched_count >= total_effective:
+        if limit is not None:
+            del items[limit:]
+        results["items"] = items
 
-        sem = asyncio.Semaphore(max_parallel_requests)
+        # pagination from first page (also "last fetched" here)
+        page = results["page"] = dict(first_page)
+        page["total"] = total_server
 
-        # ---------------------------------------------------------
-        # Cursor & Batching Setup
-        # ---------------------------------------------------------
-        BATCH_SIZE = 50000
-        has_cursor = "cursor" in first_page or "cursor" in params
-        current_cursor = params.get("cursor")
+        if fetched_all:
+            page["next"] = None  # only if we truly fetched all
 
-        all_items = list(items)
-        last_page_block = first_page if first_page else {}
-        last_page_offset = initial_offset
-        current_offset = initial_offset + page_size
+        return results
 
-        while fetched_count < total_effective:
-            # Determine max offset to reach in this batch iteration
+    limiter = AdaptiveLimiter(max_parallel_requests)
+
+    # ---------------------------------------------------------
+    # Cursor & Batching Setup
+    # ---------------------------------------------------------
+    BATCH_SIZE = CURSOR_BATCH_SIZE
+    has_cursor = "cursor" in first_page or "cursor" in params
+    current_cursor = params.get("cursor")
+
+    all_items = items
+    last_page_block = first_page
+    last_page_offset = initial_offset
+    current_offset = initial_offset + page_size
+
+    while fetched_count < total_effective:
+        # Determine max offset to reach in this batch iteration
+        if has_cursor:
+            end_offset = min(
+                BATCH_SIZE, current_offset + (total_effective - fetched_count)
+            )
+        else:
+            end_offset = total_effective
+
+        extra_offsets = list(range(current_offset, end_offset, page_size))
+
+        if not extra_offsets:
+            # Reached batch limits, jump to next batch window if using cursors
             if has_cursor:
-                end_offset = min(
-                    BATCH_SIZE, current_offset + (total_effective - fetched_count)
-                )
+                next_cursor = last_page_block.get("cursor")
+                if not next_cursor or next_cursor == current_cursor:
+                    break  # No new cursor to proceed with
+                current_cursor = next_cursor
+                current_offset = 0
+                continue
             else:
-                end_offset = total_effective
-
-            extra_offsets = list(range(current_offset, end_offset, page_size))
-
-            if not extra_offsets:
-                # Reached batch limits, jump to next batch window if using cursors
-                if has_cursor:
-                    next_cursor = last_page_block.get("cursor")
-                    if not next_cursor or next_cursor == current_cursor:
-                        break  # No new cursor to proceed with
-                    current_cursor = next_cursor
-                    current_offset = 0
-                    continue
-                else:
-                    break
-
-            pages_batch = {}
-            tasks = {}
+                break
 
-            async def fetch_page(off, cursor_val):
-                page_params = params.copy()
-                page_params["offset"] = off
-                page_params["limit"] = page_size
-                if cursor_val is not None:
-                    page_params["cursor"] = cursor_val
-                else:
-                    page_params.pop("cursor", None)
+        pages_batch = {}
+        tasks = {}
 
-                async with sem:
-                    resp = await request_wrapper_async(
-                        endpoint,
-                        page_params,
-                        body=body,
-                        session=session,
-                    )
-                return off, resp
+        async def fetch_page(off, cursor_val, sent):
+            page_params = params.copy()
+            page_params["offset"] = off
+            page_params["limit"] = page_size
+            if cursor_val is not None:
+                page_params["cursor"] = cursor_val
+            else:
+                page_params.pop("cursor", None)
+
+            async with limiter:
+                sent()
+                resp = await request_wrapper_async(
+                    endpoint,
+                    page_params,
+                    body=body,
+                    limiter=limiter,
+                )
+            return off, resp
 
+        with _RATE_WINDOW.announced(len(extra_offsets)) as sent:
             for o in extra_offsets:
-                tasks[asyncio.create_task(fetch_page(o, current_cursor))] = o
+                tasks[asyncio.create_task(fetch_page(o, current_cursor, sent))] = o
 
             highest_off_in_batch = -1
             last_page_in_batch = {}
@@ -451,49 +1209,205 @@ async def request_looper_async(
             if pending:
                 await asyncio.gather(*pending, return_exceptions=True)
 
-            # Append items sequentially for this batch
-            for off in sorted(pages_batch):
-                all_items.extend(pages_batch[off])
+        # Append items sequentially for this batch
+        for off in sorted(pages_batch):
+            all_items.extend(pages_batch[off])
+
+        # Update master trackers
+        if last_page_in_batch:
+            last_page_block = last_page_in_batch
+            last_page_offset = highest_off_in_batch
 
-            # Update master trackers
-            if last_page_in_batch:
-                last_page_block = last_page_in_batch
-                last_page_offset = highest_off_in_batch
+        if fetched_count >= total_effective:
+            break
 
-            if fetched_count >= total_effective:
+        # If strictly using cursors, extract new cursor from the last page of this batch
+        if has_cursor:
+            next_cursor = last_page_block.get("cursor")
+            if not next_cursor:
                 break
+            current_cursor = next_cursor
+            current_offset = 0  # Reset offset relative to the new cursor
+        else:
+            break  # Standard offset behavior finished
 
-            # If strictly using cursors, extract new cursor from the last page of this batch
-            if has_cursor:
-                next_cursor = last_page_block.get("cursor")
-                if not next_cursor:
-                    break
-                current_cursor = next_cursor
-                current_offset = 0  # Reset offset relative to the new cursor
-            else:
-                break  # Standard offset behavior finished
+    # Finalize and compile results
+    if limit is not None:
+        del all_items[limit:]
 
-        # Finalize and compile results
-        items = all_items
-        if limit is not None:
-            items = items[:limit]
+    results["items"] = all_items
 
-        results["items"] = items
+    # Pagination = last logical page we fetched
+    page = results["page"] = dict(last_page_block)
+    page["total"] = total_server  # always true total
 
-        # Pagination = last logical page we fetched
-        results["page"] = dict(last_page_block) if last_page_block else {}
-        results["page"]["total"] = total_server  # always true total
+    if fetched_all:
+        # only overwrite next if we truly reached the server end
+        page["next"] = None
 
-        if fetched_all:
-            # only overwrite next if we truly reached the server end
-            results["page"]["next"] = None
+    page.setdefault("offset", last_page_offset)
+    page.setdefault("limit", page_size)
+    if last_quota_remaining is not None:
+        results["quota_remaining"] = last_quota_remaining
 
-        results["page"].setdefault("offset", last_page_offset)
-        results["page"].setdefault("limit", page_size)
-        if last_quota_remaining is not None:
-            results["quota_remaining"] = last_quota_remaining
+    return results
 
-        return results
+
+async def _gather_or_cancel(coros):
+    """
+    Await the coroutines concurrently, like asyncio.gather. When one of them
+    raises, the others are cancelled before the exception propagates: otherwise
+    they would keep running (and sending requests) on the persistent loop.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        raise
+
+
+async def _iter_pages_async(
+    endpoint, params=None, body=None, max_parallel_requests=None
+):
+    """
+    Yield the items of a paginated endpoint page by page, in order.
+    Up to max_parallel_requests pages are fetched concurrently, and the next
+    window of pages is requested while the caller processes the current one:
+    at most two windows are held in memory at any time.
+    """
+    if max_parallel_requests is None:
+        max_parallel_requests = PARALLEL_REQUESTS
+
+    params = params.copy() if params else {}
+    raw_limit = params.pop("limit", None)
+    limit = int(raw_limit) if raw_limit is not None else None
+    page_size = MAX_PAGE_SIZE if limit is None else min(limit, MAX_PAGE_SIZE)
+    params["limit"] = page_size
+    offset = max(int(params.get("offset") or 0), 0)
+    params["offset"] = offset
+
+    response = await request_wrapper_async(endpoint, params.copy(), body=body)
+    if not response or "items" not in response:
+        return
+
+    page_items = response.get("items") or []
+    last_page_block = response.get("page") or {}
+    remaining = max(last_page_block.get("total", len(page_items)) - offset, 0)
+    if limit is not None:
+        remaining = min(remaining, limit)
+
+    if not page_items:
+        return
+    yield page_items[:remaining]
+    remaining -= len(page_items)
+
+    has_cursor = "cursor" in last_page_block or "cursor" in params
+    cursor = params.get("cursor")
+    next_offset = offset + page_size
+    limiter = AdaptiveLimiter(max_parallel_requests)
+
+    async def fetch_page(off, cursor_val, sent):
+        page_params = params.copy()
+        page_params["offset"] = off
+        page_params["limit"] = page_size
+        if cursor_val is not None:
+            page_params["cursor"] = cursor_val
+        async with limiter:
+            sent()
+            return await request_wrapper_async(
+                endpoint, page_params, body=body, limiter=limiter
+            )
+
+    def fetch_window():
+        """
+        Start fetching the next window of pages, None if there is none.
+        """
+        nonlocal cursor, next_offset
+        if has_cursor and next_offset >= CURSOR_BATCH_SIZE:
+            next_cursor = last_page_block.get("cursor")
+            if not next_cursor or next_cursor == cursor:
+                return None
+            cursor = next_cursor
+            next_offset = 0
+
+        end_offset = next_offset + min(
+            max_parallel_requests * page_size, -(-remaining // page_size) * page_size
+        )
+        if has_cursor:
+            end_offset = min(end_offset, CURSOR_BATCH_SIZE)
+        offsets = range(next_offset, end_offset, page_size)
+        next_offset = end_offset
+        return asyncio.ensure_future(fetch_offsets(offsets, cursor))
+
+    async def fetch_offsets(offsets, cursor_val):
+        with _RATE_WINDOW.announced(len(offsets)) as sent:
+            return await _gather_or_cancel(
+                fetch_page(o, cursor_val, sent) for o in offsets
+            )
+
+    window = fetch_window() if remaining > 0 else None
+    try:
+        while window is not None:
+            responses = await window
+            window = None
+
+            pages = []
+            for response in responses:
+                page_items = (response or {}).get("items")
+                if not page_items:
+                    remaining = 0
+                    break
+                pages.append(page_items[:remaining])
+                remaining -= len(page_items)
+                if remaining <= 0:
+                    break
+                last_page_block = response.get("page") or last_page_block
+
+            # Prefetch: the next window is in flight while these pages are consumed
+            if remaining > 0:
+                window = fetch_window()
+            for page in pages:
+                yield page
+    finally:
+        if window is not None:
+            window.cancel()
+            await asyncio.gather(window, return_exceptions=True)
+
+
+async def request_looper_iter_async(
+    endpoint,
+    params=None,
+    body=None,
+    max_parallel_requests=None,
+):
+    """
+    Async generator over the items of a paginated endpoint.
+    Unlike request_looper_async, pages are processed as they arrive and are
+    never accumulated into a single list.
+    """
+    async for page_items in _iter_pages_async(
+        endpoint, params, body, max_parallel_requests
+    ):
+        for item in page_items:
+            yield item
+
+
+def _check_sync_context():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No running loop -> normal script -> safe
+        return
+    # Already in an event loop -> calling sync API from async code is a bad idea
+    raise RuntimeError(
+        "Soundcharts sync API called from an async context. "
+        "Use the async client instead."
+    )
 
 
 def _run_blocking(coro):
@@ -502,16 +1416,18 @@ def _run_blocking(coro):
     Used to provide a sync public API on top of async internals.
     """
     try:
-        loop = asyncio.get_running_loop()
+        _check_sync_context()
     except RuntimeError:
-        # No running loop -> normal script -> safe
-        return asyncio.run(coro)
-    else:
-        # Already in an event loop -> calling sync API from async code is a bad idea
-        raise RuntimeError(
-            "Soundcharts sync API called from an async context. "
-            "Use the async client instead."
-        )
+        coro.close()
+        raise
+
+    future = _submit(coro)
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. KeyboardInterrupt: don't leave the call running on the loop
+        future.cancel()
+        raise
 
 
 def request_wrapper(
@@ -522,6 +1438,7 @@ def request_wrapper(
     retry_delay=None,
     timeout=None,
     method=None,
+    cache=False,
 ):
     """
     Public sync API: wraps the async paginator.
@@ -535,6 +1452,7 @@ def request_wrapper(
             retry_delay=retry_delay,
             timeout=timeout,
             method=method,
+            cache=cache,
         )
     )
 
@@ -544,6 +1462,9 @@ def request_looper(
     params=None,
     body=None,
     print_progress=False,
+    max_parallel_requests=None,
+    cache=False,
+    persist=False,
 ):
     """
     Public sync API: wraps the async paginator.
@@ -554,29 +1475,158 @@ def request_looper(
             params=params,
             body=body,
             print_progress=print_progress,
+            max_parallel_requests=max_parallel_requests,
+            cache=cache,
+            persist=persist,
         )
     )
 
 
+def request_looper_iter(
+    endpoint,
+    params=None,
+    body=None,
+    max_parallel_requests=None,
+):
+    """
+    Public sync API: generator over the items of a paginated endpoint.
+    The pages are fetched on the sync API loop, which keeps requesting the next
+    ones while the caller processes the current page.
+    """
+    _check_sync_context()
+    pages = _iter_pages_async(endpoint, params, body, max_parallel_requests)
+    next_page = None
+    try:
+        next_page = _submit(pages.__anext__())
+        while True:
+            try:
+                page_items = next_page.result()
+            except StopAsyncIteration:
+                return
+            next_page = _submit(pages.__anext__())
+            yield from page_items
+    finally:
+        # The generator can't be closed while it's fetching a page
+        if next_page is not None:
+            concurrent.futures.wait([next_page])
+        _submit(pages.aclose()).result()
+
+
+async def map_concurrent_async(func, keys, max_parallel_requests=None):
+    """
+    Await func(key) for every distinct key, at most max_parallel_requests at a time.
+    Returns a dictionary mapping each key to its result, in the order of keys.
+    """
+    if max_parallel_requests is None:
+        max_parallel_requests = PARALLEL_REQUESTS
+
+    keys = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(max(1, max_parallel_requests))
+
+    async def run(key):
+        async with semaphore:
+            return await func(key)
+
+    results = await _gather_or_cancel(run(key) for key in keys)
+    return dict(zip(keys, results))
+
+
+def map_concurrent(func, keys, max_parallel_requests=None):
+    """
+    Public sync API: wraps map_concurrent_async.
+    """
+    return _run_blocking(map_concurrent_async(func, keys, max_parallel_requests))
+
+
+async def request_wrapper_batch_async(calls, max_parallel_requests=None, cache=False):
+    """
+    Send many GET calls concurrently.
+    calls is an iterable of (endpoint, params) pairs; identical calls are sent once.
+    Returns the results in the order of calls, None for each call that failed with a 404.
+    """
+    calls = list(calls)
+    keys = [_cache_key("GET", endpoint, params or {}) for endpoint, params in calls]
+    calls_by_key = dict(zip(keys, calls))
+
+    async def send(key):
+        endpoint, params = calls_by_key[key]
+        return await request_wrapper_async(endpoint, params, cache=cache)
+
+    results = await map_concurrent_async(send, keys, max_parallel_requests)
+    return [results[key] for key in keys]
+
+
+def request_wrapper_batch(calls, max_parallel_requests=None, cache=False):
+    """
+    Public sync API: wraps request_wrapper_batch_async.
+    """
+    return _run_blocking(
+        request_wrapper_batch_async(calls, max_parallel_requests, cache)
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value):
+    # Daily series share the same date strings across items and calls
+    return datetime.fromisoformat(value.replace("Z", ""))
+
+
+def _sorts_lexically(values):
+    """
+    Whether ISO 8601 date strings are in chronological order when compared as
+    plain strings: same layout (hence length) and same UTC offset.
+    """
+    first = values[0]
+    if not isinstance(first, str):
+        return False
+    length = len(first)
+    # Whatever follows the seconds and their fraction: Z, +02:00...
+    offset = first[19:].lstrip(".0123456789")
+    return all(
+        isinstance(value, str)
+        and len(value) == length
+        and value[19:].lstrip(".0123456789") == offset
+        for value in values
+    )
+
+
 def sort_items_by_date(result, reverse=False, key="date"):
 
-    if result == None or len(result) == 0 or "items" not in result:
+    if result is None or len(result) == 0 or "items" not in result:
         return result
 
-    if key is not None:
-        sort_key = lambda x: datetime.fromisoformat(x[key].replace("Z", ""))
-    else:
-        sort_key = lambda x: datetime.fromisoformat(x.replace("Z", ""))
+    # In place, no copy of the list. Pages come back already ordered, and
+    # Timsort merges such pre-sorted runs in O(N log P) for P pages (O(N) when
+    # the whole list is already sorted), so this is the k-way merge for free.
+    items = result["items"]
+    if len(items) < 2:
+        return result
 
-    result["items"] = sorted(
-        result["items"],
-        key=sort_key,
-        reverse=reverse,
-    )
+    values = items if key is None else [item[key] for item in items]
+    if _sorts_lexically(values):
+        # Plain string comparisons, no datetime built per item
+        sort_key = None if key is None else itemgetter(key)
+    elif key is not None:
+        sort_key = lambda x: _parse_date(x[key])
+    else:
+        sort_key = _parse_date
+    items.sort(key=sort_key, reverse=reverse)
 
     return result
 
 
+def is_past_date(value):
+    """
+    Whether a YYYY-MM-DD date is strictly before today: data up to that date is final.
+    """
+    if not value:
+        return False
+    try:
+        return date.fromisoformat(str(value)[:10]) < date.today()
+    except ValueError:
+        return False
+
+
 def list_join(list, separator=","):
     result_string = separator.join(str(item) for item in list)
     return result_string
@@ -4,6 +4,7 @@ from .api_util import (
     request_wrapper_async,
     request_looper_async,
     sort_items_by_date,
+    is_past_date,
     list_join,
 )
 from datetime import datetime
@@ -28,13 +29,13 @@ class Artist:
         :param country_code: Add a country to get artists ranked by their stats in that specific country. Avalaible values: country code of 2 letters ISO 3166-2, example: 'US', full list on https://en.wikipedia.org/wiki/ISO_3166-2. Leave empty to get the artists list based on their global stats.
         :param city_key: Add a cityKey and a countryCode to get artists ranked by their stats in that specific city. Available values are listed in the "referential/get cities for artist ranking" endpoint (https://developers.soundcharts.com/documentation/reference/referential/get-cities-for-artist-ranking).
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (spotify followers for global ranking, instagram followers for country ranking, spotify monthly listeners for city ranking) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
+        if body is None:
             platform, metric_type = "spotify", "followers"
             if country_code:
                 platform = "instagram"
@@ -183,7 +184,7 @@ class Artist:
 
         endpoint = f"/api/v2/artist/{artist_uuid}/related"
         params = {"offset": offset, "limit": limit}
-        result = request_wrapper(endpoint, params)
+        result = request_looper(endpoint, params)
         return result if result is not None else {}
 
     @staticmethod
@@ -223,7 +224,7 @@ class Artist:
             "offset": offset,
             "limit": limit,
         }
-        result = request_wrapper(endpoint, params)
+        result = request_looper(endpoint, params)
         return result if result is not None else {}
 
     @staticmethod
@@ -254,7 +255,7 @@ class Artist:
             "offset": offset,
             "limit": limit,
         }
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, persist=is_past_date(end_date))
         return {} if result is None or len(result) == 0 else sort_items_by_date(result)
 
     @staticmethod
@@ -405,7 +406,7 @@ class Artist:
             "offset": offset,
             "limit": limit,
         }
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, persist=is_past_date(end_date))
         return {} if result is None else sort_items_by_date(result)
 
     @staticmethod
@@ -684,7 +685,7 @@ class Artist:
             "offset": offset,
             "limit": limit,
         }
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, persist=is_past_date(end_date))
         return result if result is not None else {}
 
     @staticmethod
@@ -795,13 +796,13 @@ class ArtistAsync:
         :param country_code: Add a country to get artists ranked by their stats in that specific country. Avalaible values: country code of 2 letters ISO 3166-2, example: 'US', full list on https://en.wikipedia.org/wiki/ISO_3166-2. Leave empty to get the artists list based on their global stats.
         :param city_key: Add a cityKey and a countryCode to get artists ranked by their stats in that specific city. Available values are listed in the "referential/get cities for artist ranking" endpoint (https://developers.soundcharts.com/documentation/reference/referential/get-cities-for-artist-ranking).
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (spotify followers for global ranking, instagram followers for country ranking, spotify monthly listeners for city ranking) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
+        if body is None:
             platform, metric_type = "spotify", "followers"
             if country_code:
                 platform = "instagram"
@@ -955,7 +956,7 @@ class ArtistAsync:
 
         endpoint = f"/api/v2/artist/{artist_uuid}/related"
         params = {"offset": offset, "limit": limit}
-        result = await request_wrapper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params)
         return result if result is not None else {}
 
     @staticmethod
@@ -995,7 +996,7 @@ class ArtistAsync:
             "offset": offset,
             "limit": limit,
         }
-        result = await request_wrapper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params)
         return result if result is not None else {}
 
     @staticmethod
@@ -1026,7 +1027,9 @@ class ArtistAsync:
             "offset": offset,
             "limit": limit,
         }
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(
+            endpoint, params, persist=is_past_date(end_date)
+        )
         return {} if result is None or len(result) == 0 else sort_items_by_date(result)
 
     @staticmethod
@@ -1177,7 +1180,9 @@ class ArtistAsync:
             "offset": offset,
             "limit": limit,
         }
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(
+            endpoint, params, persist=is_past_date(end_date)
+        )
         return {} if result is None else sort_items_by_date(result)
 
     @staticmethod
@@ -1447,7 +1452,9 @@ class ArtistAsync:
             "offset": offset,
             "limit": limit,
         }
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(
+            endpoint, params, persist=is_past_date(end_date)
+        )
         return result if result is not None else {}
 
     @staticmethod
@@ -1,29 +1,83 @@
-import importlib.util
+import functools
+import importlib
 import logging
-from .api_util import setup as api_setup
-from .search import Search, SearchAsync
-from .artist import Artist, ArtistAsync
-from .collaborator import Collaborator, CollaboratorAsync
-from .song import Song, SongAsync
-from .album import Album, AlbumAsync
-from .charts import Charts, ChartsAsync
-from .playlist import Playlist, PlaylistAsync
-from .radio import Radio, RadioAsync
-from .festival import Festival, FestivalAsync
-from .venue import Venue, VenueAsync
-from .tiktok import Tiktok, TiktokAsync
-from .user import User, UserAsync
-from .mylibrary import MyLibrary, MyLibraryAsync
-from .referential import Referential, ReferentialAsync
-from .publisher import Publisher, PublisherAsync
-from .work import Work, WorkAsync
-
-
-class SoundchartsClient:
+from .api_util import setup as api_setup, close as api_close, close_async
+
+
+@functools.lru_cache(maxsize=None)
+def _submodule_class(module_name, class_name):
+    """
+    Resolve a submodule class once per process, None if its module isn't shipped.
+    A failed import is remembered too, so it isn't searched for again.
+    """
+    try:
+        module = importlib.import_module(module_name, __package__)
+    except ModuleNotFoundError as e:
+        if e.name != f"{__package__}{module_name}":
+            raise
+        return None
+    return getattr(module, class_name)
+
+
+class _LazySubmodules:
+    """
+    Imports and instantiates the endpoint submodules on first access only.
+    """
+
+    # Attribute name -> (module, class name)
+    _SUBMODULES = {}
+    _OPTIONAL_SUBMODULES = {"test"}
+
+    def __getattr__(self, name):
+        try:
+            module_name, class_name = self._SUBMODULES[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+        submodule_class = _submodule_class(module_name, class_name)
+        if submodule_class is None:
+            # Optional submodules, such as 'test', may not be shipped
+            if name not in self._OPTIONAL_SUBMODULES:
+                raise ModuleNotFoundError(f"No module named {module_name!r}")
+            submodule = None
+        else:
+            submodule = submodule_class()
+
+        # Stored on the instance, so later accesses don't go through __getattr__
+        self.__dict__[name] = submodule
+        return submodule
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | self._SUBMODULES.keys())
+
+
+class SoundchartsClient(_LazySubmodules):
     """
     Main client for interacting with the Soundcharts API.
     """
 
+    _SUBMODULES = {
+        "search": (".search", "Search"),
+        "artist": (".artist", "Artist"),
+        "collaborator": (".collaborator", "Collaborator"),
+        "song": (".song", "Song"),
+        "album": (".album", "Album"),
+        "charts": (".charts", "Charts"),
+        "playlist": (".playlist", "Playlist"),
+        "radio": (".radio", "Radio"),
+        "festival": (".festival", "Festival"),
+        "venue": (".venue", "Venue"),
+        "tiktok": (".tiktok", "Tiktok"),
+        "user": (".user", "User"),
+        "mylibrary": (".mylibrary", "MyLibrary"),
+        "referential": (".referential", "Referential"),
+        "publisher": (".publisher", "Publisher"),
+        "work": (".work", "Work"),
+        "test": (".test", "Test"),
+    }
+
     def __init__(
         self,
         app_id,
@@ -36,6 +90,12 @@ class SoundchartsClient:
         console_log_level=logging.WARNING,
         file_log_level=logging.WARNING,
         exception_log_level=logging.ERROR,
+        cache_ttl=3600,
+        cache_size=4096,
+        backoff_cap=30,
+        jitter=0.5,
+        not_found_ttl=300,
+        cache_dir=None,
     ):
         """
         Initialize the Soundcharts client. Use the logging python library to specify the logging level.
@@ -46,60 +106,80 @@ class SoundchartsClient:
         :param base_url: Base URL for API. Default: production.
         :param parallel_requests: How many queries can run in parallel. Default: 5.
         :param max_retries: Max number of retries in case of an error 500. Default: 5.
-        :param retry_delay: Time in seconds between retries for a 500 error. Default: 10.
+        :param retry_delay: Time in seconds before the first retry for a 500 error. Default: 10.
         :param console_log_level: The severity of issues written to the console. Default: logging.WARNING.
         :param file_log_level: The severity of issues written to the logging file. Default: logging.WARNING.
         :param exception_log_level: The severity of issues that cause exceptions. Default: logging.ERROR.
+        :param cache_ttl: Time in seconds during which responses of cacheable endpoints (e.g. metadata lookups) are reused. 0 disables the cache. Default: 3600.
+        :param cache_size: Maximum number of cached responses. Default: 4096.
+        :param backoff_cap: The delay between retries doubles after each attempt (starting at retry_delay), up to this many seconds. Default: 30.
+        :param jitter: Random extra share of the retry delay, so that concurrent clients don't retry in lockstep. Default: 0.5.
+        :param not_found_ttl: Time in seconds during which GET requests that returned a 404 are answered without calling the API again. 0 disables it. Default: 300.
+        :param cache_dir: Directory of a persistent cache, kept across runs, for responses that can no longer change (e.g. audience over a past period). Default: the SOUNDCHARTS_CACHE_DIR environment variable, or no disk cache.
         """
         self.base_url = base_url
 
         api_setup(
-            app_id,
-            api_key,
-            base_url,
-            parallel_requests,
-            max_retries,
-            retry_delay,
-            timeout,
-            console_log_level,
-            file_log_level,
-            exception_log_level,
+            app_id=app_id,
+            api_key=api_key,
+            base_url=base_url,
+            parallel_requests=parallel_requests,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            timeout=timeout,
+            console_log_level=console_log_level,
+            file_log_level=file_log_level,
+            exception_log_level=exception_log_level,
+            cache_ttl=cache_ttl,
+            cache_size=cache_size,
+            backoff_cap=backoff_cap,
+            jitter=jitter,
+            not_found_ttl=not_found_ttl,
+            cache_dir=cache_dir,
         )
 
-        # Initialize submodules
-        self.search = Search()
-        self.artist = Artist()
-        self.collaborator = Collaborator()
-        self.song = Song()
-        self.album = Album()
-        self.charts = Charts()
-        self.playlist = Playlist()
-        self.radio = Radio()
-        self.festival = Festival()
-        self.venue = Venue()
-        self.tiktok = Tiktok()
-        self.user = User()
-        self.mylibrary = MyLibrary()
-        self.referential = Referential()
-        self.publisher = Publisher()
-        self.work = Work()
-
-        # Conditionally import 'test' submodule if test.py exists
-        try:
-            test_module = importlib.import_module("soundcharts.test")
-            self.test = test_module.Test()
-        except ModuleNotFoundError:
-            self.test = None
+    def close(self):
+        """
+        Close the pooled HTTP connections. Useful for long-running processes;
+        they are otherwise released when the interpreter exits.
+        """
+        api_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __repr__(self):
         return f"SoundchartsClient(base_url={self.base_url})"
 
 
-class SoundchartsClientAsync:
+class SoundchartsClientAsync(_LazySubmodules):
     """
     Main client for interacting with the Soundcharts API.
     """
 
+    _SUBMODULES = {
+        "search": (".search", "SearchAsync"),
+        "artist": (".artist", "ArtistAsync"),
+        "collaborator": (".collaborator", "CollaboratorAsync"),
+        "song": (".song", "SongAsync"),
+        "album": (".album", "AlbumAsync"),
+        "charts": (".charts", "ChartsAsync"),
+        "playlist": (".playlist", "PlaylistAsync"),
+        "radio": (".radio", "RadioAsync"),
+        "festival": (".festival", "FestivalAsync"),
+        "venue": (".venue", "VenueAsync"),
+        "tiktok": (".tiktok", "TiktokAsync"),
+        "user": (".user", "UserAsync"),
+        "mylibrary": (".mylibrary", "MyLibraryAsync"),
+        "referential": (".referential", "ReferentialAsync"),
+        "publisher": (".publisher", "PublisherAsync"),
+        "work": (".work", "WorkAsync"),
+        "test": (".test", "TestAsync"),
+    }
+
     def __init__(
         self,
         app_id,
@@ -112,6 +192,12 @@ class SoundchartsClientAsync:
         console_log_level=logging.WARNING,
         file_log_level=logging.WARNING,
         exception_log_level=logging.ERROR,
+        cache_ttl=3600,
+        cache_size=4096,
+        backoff_cap=30,
+        jitter=0.5,
+        not_found_ttl=300,
+        cache_dir=None,
     ):
         """
         Initialize the Soundcharts client. Use the logging python library to specify the logging level.
@@ -122,51 +208,51 @@ class SoundchartsClientAsync:
         :param base_url: Base URL for API. Default: production.
         :param parallel_requests: How many queries can run in parallel. Default: 5.
         :param max_retries: Max number of retries in case of an error 500. Default: 5.
-        :param retry_delay: Time in seconds between retries for a 500 error. Default: 10.
+        :param retry_delay: Time in seconds before the first retry for a 500 error. Default: 10.
         :param console_log_level: The severity of issues written to the console. Default: logging.WARNING.
         :param file_log_level: The severity of issues written to the logging file. Default: logging.WARNING.
         :param exception_log_level: The severity of issues that cause exceptions. Default: logging.ERROR.
+        :param cache_ttl: Time in seconds during which responses of cacheable endpoints (e.g. metadata lookups) are reused. 0 disables the cache. Default: 3600.
+        :param cache_size: Maximum number of cached responses. Default: 4096.
+        :param backoff_cap: The delay between retries doubles after each attempt (starting at retry_delay), up to this many seconds. Default: 30.
+        :param jitter: Random extra share of the retry delay, so that concurrent clients don't retry in lockstep. Default: 0.5.
+        :param not_found_ttl: Time in seconds during which GET requests that returned a 404 are answered without calling the API again. 0 disables it. Default: 300.
+        :param cache_dir: Directory of a persistent cache, kept across runs, for responses that can no longer change (e.g. audience over a past period). Default: the SOUNDCHARTS_CACHE_DIR environment variable, or no disk cache.
         """
 
         self.base_url = base_url
 
         api_setup(
-            app_id,
-            api_key,
-            base_url,
-            parallel_requests,
-            max_retries,
-            retry_delay,
-            timeout,
-            console_log_level,
-            file_log_level,
-            exception_log_level,
+            app_id=app_id,
+            api_key=api_key,
+            base_url=base_url,
+            parallel_requests=parallel_requests,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            timeout=timeout,
+            console_log_level=console_log_level,
+            file_log_level=file_log_level,
+            exception_log_level=exception_log_level,
+            cache_ttl=cache_ttl,
+            cache_size=cache_size,
+            backoff_cap=backoff_cap,
+            jitter=jitter,
+            not_found_ttl=not_found_ttl,
+            cache_dir=cache_dir,
         )
 
-        # Initialize submodules
-        self.search = SearchAsync()
-        self.artist = ArtistAsync()
-        self.collaborator = CollaboratorAsync()
-        self.song = SongAsync()
-        self.album = AlbumAsync()
-        self.charts = ChartsAsync()
-        self.playlist = PlaylistAsync()
-        self.radio = RadioAsync()
-        self.festival = FestivalAsync()
-        self.venue = VenueAsync()
-        self.tiktok = TiktokAsync()
-        self.user = UserAsync()
-        self.mylibrary = MyLibraryAsync()
-        self.referential = ReferentialAsync()
-        self.publisher = PublisherAsync()
-        self.work = WorkAsync()
-
-        # Conditionally import 'test' submodule if test.py exists
-        try:
-            test_module = importlib.import_module("soundcharts.test")
-            self.test = test_module.TestAsync()
-        except ModuleNotFoundError:
-            self.test = None
+    async def close(self):
+        """
+        Close the pooled HTTP connections of the running event loop.
+        They are otherwise released when the event loop shuts down.
+        """
+        await close_async()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
 
     def __repr__(self):
         return f"SoundchartsClientAsync(base_url={self.base_url})"
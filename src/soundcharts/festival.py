@@ -6,6 +6,9 @@ from .api_util import (
     sort_items_by_date,
 )
 
+# Static endpoints, shared by the sync and async classes
+_EP_TOP_FESTIVALS = "/api/v2/top/festivals"
+
 
 class Festival:
 
@@ -23,13 +26,13 @@ class Festival:
         You'll find available platfom/metricType combinations in the documentation: https://developers.soundcharts.com/documentation/reference/festival/get-festivals
 
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (descending soundcharts score) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
+        if body is None:
             platform, metric_type = "soundcharts", "score"
 
             body = {
@@ -43,7 +46,7 @@ class Festival:
                 "filters": [],
             }
 
-        endpoint = f"/api/v2/top/festivals"
+        endpoint = _EP_TOP_FESTIVALS
         params = {
             "offset": offset,
             "limit": limit,
@@ -149,13 +152,13 @@ class FestivalAsync:
         You'll find available platfom/metricType combinations in the documentation: https://developers.soundcharts.com/documentation/reference/festival/get-festivals
 
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (descending soundcharts score) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
+        if body is None:
             platform, metric_type = "soundcharts", "score"
 
             body = {
@@ -169,7 +172,7 @@ class FestivalAsync:
                 "filters": [],
             }
 
-        endpoint = f"/api/v2/top/festivals"
+        endpoint = _EP_TOP_FESTIVALS
         params = {
             "offset": offset,
             "limit": limit,
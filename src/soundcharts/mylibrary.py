@@ -3,8 +3,191 @@ from .api_util import (
     request_looper_async,
     request_wrapper,
     request_wrapper_async,
+    map_concurrent,
+    map_concurrent_async,
+    logger,
+    PartialFailureError,
 )
 
+# Static endpoints, shared by the sync and async classes
+_EP_LIBRARY_ARTIST = "/api/v2/library/artist"
+_EP_LIBRARY_SONG = "/api/v2/library/song"
+
+# Larger lists are split into several calls, sent concurrently
+MAX_IDS_PER_CALL = 500
+
+
+def _merge_responses(responses):
+    """
+    Combine the responses of the calls a list of identifiers was split into:
+    lists are concatenated and numbers (e.g. counts) are added up. Other values
+    are kept if every response agrees, otherwise listed in the order of the calls.
+    """
+    merged = {}
+    disagree = set()
+    for response in responses:
+        if not isinstance(response, dict):
+            continue
+        for key, value in response.items():
+            if key not in merged:
+                merged[key] = value
+            elif key == "quota_remaining":
+                if value is not None and merged[key] is not None:
+                    merged[key] = min(merged[key], value)
+            elif isinstance(value, list) and isinstance(merged[key], list):
+                merged[key] = merged[key] + value
+            elif _is_number(value) and _is_number(merged[key]):
+                merged[key] += value
+            elif key in disagree:
+                merged[key].append(value)
+            elif value != merged[key]:
+                disagree.add(key)
+                merged[key] = [merged[key], value]
+    return merged
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_ids(identifiers):
+    for item in identifiers:
+        if (
+            not isinstance(item, dict)
+            or not isinstance(item.get("identifier"), (str, int))
+            or not isinstance(item.get("platformCode"), str)
+        ):
+            raise ValueError(
+                f"Malformed identifier {item!r}: expected a dict with 'identifier' and 'platformCode'."
+            )
+
+
+def _id_key(item):
+    return item["platformCode"], item["identifier"]
+
+
+def _dedupe_ids(identifiers):
+    unique = {}
+    for item in identifiers:
+        unique.setdefault(_id_key(item), item)
+    if len(unique) < len(identifiers):
+        logger.debug(
+            "Removed %s duplicate identifiers.", len(identifiers) - len(unique)
+        )
+        return list(unique.values())
+    return identifiers
+
+
+def _shard(identifiers):
+    identifiers = list(identifiers)
+    _check_ids(identifiers)
+    identifiers = _dedupe_ids(identifiers)
+    return [
+        identifiers[i : i + MAX_IDS_PER_CALL]
+        for i in range(0, len(identifiers), MAX_IDS_PER_CALL)
+    ] or [identifiers]
+
+
+def _shard_sender(endpoint, shards, method):
+    async def send(i):
+        # Every call runs to completion, so that the outcome of each one is known
+        try:
+            return await request_wrapper_async(
+                endpoint, body={"identifiers": shards[i]}, method=method
+            )
+        except Exception as e:
+            return e
+
+    return send
+
+
+def _collect_shards(results):
+    """
+    Merge the responses of the calls a list of identifiers was split into, with
+    the indexes of the calls that succeeded and failed under "shards".
+    Raises PartialFailureError if a call raised.
+    """
+    succeeded = [
+        i
+        for i, result in results.items()
+        if result is not None and not isinstance(result, Exception)
+    ]
+    failed = [i for i in results if i not in succeeded]
+    merged = _merge_responses(results[i] for i in succeeded)
+    merged["shards"] = {"succeeded": succeeded, "failed": failed}
+
+    if failed:
+        message = (
+            f"{len(failed)} of {len(results)} calls failed (calls {failed}, "
+            f"{MAX_IDS_PER_CALL} identifiers each); calls {succeeded} were applied."
+        )
+        errors = [e for e in results.values() if isinstance(e, Exception)]
+        if errors:
+            raise PartialFailureError(message, succeeded, failed, merged) from errors[0]
+        logger.error(message)
+    return merged
+
+
+def _send_ids(endpoint, identifiers, method=None):
+    shards = _shard(identifiers)
+    if len(shards) == 1:
+        result = request_wrapper(
+            endpoint, body={"identifiers": shards[0]}, method=method
+        )
+        return result if result is not None else {}
+
+    send = _shard_sender(endpoint, shards, method)
+    return _collect_shards(map_concurrent(send, range(len(shards))))
+
+
+async def _send_ids_async(endpoint, identifiers, method=None):
+    shards = _shard(identifiers)
+    if len(shards) == 1:
+        result = await request_wrapper_async(
+            endpoint, body={"identifiers": shards[0]}, method=method
+        )
+        return result if result is not None else {}
+
+    send = _shard_sender(endpoint, shards, method)
+    return _collect_shards(await map_concurrent_async(send, range(len(shards))))
+
+
+def _update_calls(endpoint, add, delete):
+    # Both lists are sent concurrently, so the outcome for an identifier in
+    # both of them would depend on which call the API handles last
+    add, delete = list(add or []), list(delete or [])
+    _check_ids(add)
+    _check_ids(delete)
+    overlap = {_id_key(item) for item in add} & {_id_key(item) for item in delete}
+    if overlap:
+        raise ValueError(
+            f"{len(overlap)} identifiers are both added and deleted, e.g. {next(iter(overlap))!r}."
+        )
+
+    calls = {}
+    if add:
+        calls["added"] = (add, None)
+    if delete:
+        calls["deleted"] = (delete, "delete")
+
+    async def send(key):
+        identifiers, method = calls[key]
+        return await _send_ids_async(endpoint, identifiers, method)
+
+    return send, calls
+
+
+def _update_ids(endpoint, add, delete):
+    send, calls = _update_calls(endpoint, add, delete)
+    results = map_concurrent(send, calls) if calls else {}
+    return {"added": results.get("added", {}), "deleted": results.get("deleted", {})}
+
+
+async def _update_ids_async(endpoint, add, delete):
+    send, calls = _update_calls(endpoint, add, delete)
+    results = await map_concurrent_async(send, calls) if calls else {}
+    return {"added": results.get("added", {}), "deleted": results.get("deleted", {})}
+
 
 class MyLibrary:
 
@@ -19,7 +202,7 @@ class MyLibrary:
         """
         params = {"offset": offset, "limit": limit}
 
-        endpoint = f"/api/v2/library/artist"
+        endpoint = _EP_LIBRARY_ARTIST
         result = request_looper(endpoint, params)
         return result if result is not None else {}
 
@@ -28,6 +211,10 @@ class MyLibrary:
         """
         Add artists to your personal library. This endpoint is restricted to specific plans.
 
+        Lists of more than MAX_IDS_PER_CALL identifiers are split into concurrent calls: the merged
+        response then has the indexes of the "succeeded" and "failed" calls under "shards",
+        and PartialFailureError is raised if some of them failed.
+
         :param identifiers: A list of dicts structured like :
             [{
                 "identifier": "9635624",
@@ -37,17 +224,17 @@ class MyLibrary:
             ]
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/library/artist"
-
-        body = {"identifiers": identifiers}
-
-        result = request_wrapper(endpoint, body=body)
-        return result if result is not None else {}
+        endpoint = _EP_LIBRARY_ARTIST
+        return _send_ids(endpoint, identifiers)
 
     @staticmethod
     def delete_artists_ids(identifiers):
         """
-        Add artists to your personal library. This endpoint is restricted to specific plans.
+        Delete artists from your personal library. This endpoint is restricted to specific plans.
+
+        Lists of more than MAX_IDS_PER_CALL identifiers are split into concurrent calls: the merged
+        response then has the indexes of the "succeeded" and "failed" calls under "shards",
+        and PartialFailureError is raised if some of them failed.
 
         :param identifiers: A list of dicts structured like :
             [{
@@ -58,12 +245,8 @@ class MyLibrary:
             ]
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/library/artist"
-
-        body = {"identifiers": identifiers}
-
-        result = request_wrapper(endpoint, body=body, method="delete")
-        return result if result is not None else {}
+        endpoint = _EP_LIBRARY_ARTIST
+        return _send_ids(endpoint, identifiers, method="delete")
 
     @staticmethod
     def get_song_list(offset=0, limit=100):
@@ -76,7 +259,7 @@ class MyLibrary:
         """
         params = {"offset": offset, "limit": limit}
 
-        endpoint = f"/api/v2/library/song"
+        endpoint = _EP_LIBRARY_SONG
         result = request_looper(endpoint, params)
         return result if result is not None else {}
 
@@ -85,6 +268,10 @@ class MyLibrary:
         """
         Add songs to your personal library. This endpoint is restricted to specific plans.
 
+        Lists of more than MAX_IDS_PER_CALL identifiers are split into concurrent calls: the merged
+        response then has the indexes of the "succeeded" and "failed" calls under "shards",
+        and PartialFailureError is raised if some of them failed.
+
         :param identifiers: A list of dicts structured like :
             [{
                 "identifier": "9635624",
@@ -94,17 +281,17 @@ class MyLibrary:
             ]
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/library/song"
-
-        body = {"identifiers": identifiers}
-
-        result = request_wrapper(endpoint, body=body)
-        return result if result is not None else {}
+        endpoint = _EP_LIBRARY_SONG
+        return _send_ids(endpoint, identifiers)
 
     @staticmethod
     def delete_songs_ids(identifiers):
         """
-        Add songs to your personal library. This endpoint is restricted to specific plans.
+        Delete songs from your personal library. This endpoint is restricted to specific plans.
+
+        Lists of more than MAX_IDS_PER_CALL identifiers are split into concurrent calls: the merged
+        response then has the indexes of the "succeeded" and "failed" calls under "shards",
+        and PartialFailureError is raised if some of them failed.
 
         :param identifiers: A list of dicts structured like :
             [{
@@ -115,12 +302,36 @@ class MyLibrary:
             ]
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/library/song"
+        endpoint = _EP_LIBRARY_SONG
+        return _send_ids(endpoint, identifiers, method="delete")
 
-        body = {"identifiers": identifiers}
+    @staticmethod
+    def update_artists_ids(add=None, delete=None):
+        """
+        Add and delete artists of your personal library at once, both sent concurrently.
+        An identifier can't be in both lists: ValueError is raised before anything is sent.
+        This endpoint is restricted to specific plans.
 
-        result = request_wrapper(endpoint, body=body, method="delete")
-        return result if result is not None else {}
+        :param add: A list of identifiers to add, structured like the add_artists_ids ones.
+        :param delete: A list of identifiers to delete, structured like the delete_artists_ids ones.
+        :return: Dictionary with the "added" and "deleted" JSON responses (empty dictionaries if nothing was sent).
+        """
+        endpoint = _EP_LIBRARY_ARTIST
+        return _update_ids(endpoint, add, delete)
+
+    @staticmethod
+    def update_songs_ids(add=None, delete=None):
+        """
+        Add and delete songs of your personal library at once, both sent concurrently.
+        An identifier can't be in both lists: ValueError is raised before anything is sent.
+        This endpoint is restricted to specific plans.
+
+        :param add: A list of identifiers to add, structured like the add_songs_ids ones.
+        :param delete: A list of identifiers to delete, structured like the delete_songs_ids ones.
+        :return: Dictionary with the "added" and "deleted" JSON responses (empty dictionaries if nothing was sent).
+        """
+        endpoint = _EP_LIBRARY_SONG
+        return _update_ids(endpoint, add, delete)
 
 
 class MyLibraryAsync:
@@ -136,7 +347,7 @@ class MyLibraryAsync:
         """
         params = {"offset": offset, "limit": limit}
 
-        endpoint = f"/api/v2/library/artist"
+        endpoint = _EP_LIBRARY_ARTIST
         result = await request_looper_async(endpoint, params)
         return result if result is not None else {}
 
@@ -145,6 +356,10 @@ class MyLibraryAsync:
         """
         Add artists to your personal library. This endpoint is restricted to specific plans.
 
+        Lists of more than MAX_IDS_PER_CALL identifiers are split into concurrent calls: the merged
+        response then has the indexes of the "succeeded" and "failed" calls under "shards",
+        and PartialFailureError is raised if some of them failed.
+
         :param identifiers: A list of dicts structured like :
             [{
                 "identifier": "9635624",
@@ -154,17 +369,17 @@ class MyLibraryAsync:
             ]
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/library/artist"
-
-        body = {"identifiers": identifiers}
-
-        result = await request_wrapper_async(endpoint, body=body)
-        return result if result is not None else {}
+        endpoint = _EP_LIBRARY_ARTIST
+        return await _send_ids_async(endpoint, identifiers)
 
     @staticmethod
     async def delete_artists_ids(identifiers):
         """
-        Add artists to your personal library. This endpoint is restricted to specific plans.
+        Delete artists from your personal library. This endpoint is restricted to specific plans.
+
+        Lists of more than MAX_IDS_PER_CALL identifiers are split into concurrent calls: the merged
+        response then has the indexes of the "succeeded" and "failed" calls under "shards",
+        and PartialFailureError is raised if some of them failed.
 
         :param identifiers: A list of dicts structured like :
             [{
@@ -175,14 +390,8 @@ class MyLibraryAsync:
             ]
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/library/artist"
-
-        body = {"identifiers": identifiers}
-
-        result = await request_wrapper_async(
-            endpoint, body=body, method="delete"
-        )
-        return result if result is not None else {}
+        endpoint = _EP_LIBRARY_ARTIST
+        return await _send_ids_async(endpoint, identifiers, method="delete")
 
     @staticmethod
     async def get_song_list(offset=0, limit=100):
@@ -195,7 +404,7 @@ class MyLibraryAsync:
         """
         params = {"offset": offset, "limit": limit}
 
-        endpoint = f"/api/v2/library/song"
+        endpoint = _EP_LIBRARY_SONG
         result = await request_looper_async(endpoint, params)
         return result if result is not None else {}
 
@@ -204,6 +413,10 @@ class MyLibraryAsync:
         """
         Add songs to your personal library. This endpoint is restricted to specific plans.
 
+        Lists of more than MAX_IDS_PER_CALL identifiers are split into concurrent calls: the merged
+        response then has the indexes of the "succeeded" and "failed" calls under "shards",
+        and PartialFailureError is raised if some of them failed.
+
         :param identifiers: A list of dicts structured like :
             [{
                 "identifier": "9635624",
@@ -213,17 +426,17 @@ class MyLibraryAsync:
             ]
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/library/song"
-
-        body = {"identifiers": identifiers}
-
-        result = await request_wrapper_async(endpoint, body=body)
-        return result if result is not None else {}
+        endpoint = _EP_LIBRARY_SONG
+        return await _send_ids_async(endpoint, identifiers)
 
     @staticmethod
     async def delete_songs_ids(identifiers):
         """
-        Add songs to your personal library. This endpoint is restricted to specific plans.
+        Delete songs from your personal library. This endpoint is restricted to specific plans.
+
+        Lists of more than MAX_IDS_PER_CALL identifiers are split into concurrent calls: the merged
+        response then has the indexes of the "succeeded" and "failed" calls under "shards",
+        and PartialFailureError is raised if some of them failed.
 
         :param identifiers: A list of dicts structured like :
             [{
@@ -234,11 +447,33 @@ class MyLibraryAsync:
             ]
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/library/song"
+        endpoint = _EP_LIBRARY_SONG
+        return await _send_ids_async(endpoint, identifiers, method="delete")
+
+    @staticmethod
+    async def update_artists_ids(add=None, delete=None):
+        """
+        Add and delete artists of your personal library at once, both sent concurrently.
+        An identifier can't be in both lists: ValueError is raised before anything is sent.
+        This endpoint is restricted to specific plans.
 
-        body = {"identifiers": identifiers}
+        :param add: A list of identifiers to add, structured like the add_artists_ids ones.
+        :param delete: A list of identifiers to delete, structured like the delete_artists_ids ones.
+        :return: Dictionary with the "added" and "deleted" JSON responses (empty dictionaries if nothing was sent).
+        """
+        endpoint = _EP_LIBRARY_ARTIST
+        return await _update_ids_async(endpoint, add, delete)
 
-        result = await request_wrapper_async(
-            endpoint, body=body, method="delete"
-        )
-        return result if result is not None else {}
+    @staticmethod
+    async def update_songs_ids(add=None, delete=None):
+        """
+        Add and delete songs of your personal library at once, both sent concurrently.
+        An identifier can't be in both lists: ValueError is raised before anything is sent.
+        This endpoint is restricted to specific plans.
+
+        :param add: A list of identifiers to add, structured like the add_songs_ids ones.
+        :param delete: A list of identifiers to delete, structured like the delete_songs_ids ones.
+        :return: Dictionary with the "added" and "deleted" JSON responses (empty dictionaries if nothing was sent).
+        """
+        endpoint = _EP_LIBRARY_SONG
+        return await _update_ids_async(endpoint, add, delete)
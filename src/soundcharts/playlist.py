@@ -17,7 +17,7 @@ class Playlist:
 
         :param platform: A playlist Chart platform code. Default: spotify.
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (by metric for the platforms who have one, by 28DayAdds for others) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
@@ -31,7 +31,7 @@ class Playlist:
             "boomplay": "favorites",
         }
 
-        if body == None:
+        if body is None:
             body = {
                 "sort": {
                     "type": "28DayAdds",
@@ -252,7 +252,7 @@ class PlaylistAsync:
 
         :param platform: A playlist Chart platform code. Default: spotify.
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (by metric for the platforms who have one, by 28DayAdds for others) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
@@ -266,7 +266,7 @@ class PlaylistAsync:
             "boomplay": "favorites",
         }
 
-        if body == None:
+        if body is None:
             body = {
                 "sort": {
                     "type": "28DayAdds",
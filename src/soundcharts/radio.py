@@ -6,6 +6,9 @@ from .api_util import (
     sort_items_by_date,
 )
 
+# Static endpoints, shared by the sync and async classes
+_EP_TOP_RADIOS = "/api/v2/top/radios"
+
 
 class Radio:
 
@@ -23,13 +26,13 @@ class Radio:
         You'll find available platfom/metricType combinations in the documentation: https://developers.soundcharts.com/documentation/reference/radio/get-radios
 
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (descending soundcharts score) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
+        if body is None:
             platform, metric_type = "soundcharts", "reach"
 
             body = {
@@ -43,7 +46,7 @@ class Radio:
                 "filters": [],
             }
 
-        endpoint = f"/api/v2/top/radios"
+        endpoint = _EP_TOP_RADIOS
         params = {
             "offset": offset,
             "limit": limit,
@@ -109,13 +112,13 @@ class RadioAsync:
         You'll find available platfom/metricType combinations in the documentation: https://developers.soundcharts.com/documentation/reference/radio/get-radios
 
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take up to 100,000 calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (descending soundcharts score) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
+        if body is None:
             platform, metric_type = "soundcharts", "reach"
 
             body = {
@@ -129,7 +132,7 @@ class RadioAsync:
                 "filters": [],
             }
 
-        endpoint = f"/api/v2/top/radios"
+        endpoint = _EP_TOP_RADIOS
         params = {
             "offset": offset,
             "limit": limit,
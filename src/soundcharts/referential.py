@@ -1,13 +1,51 @@
 from .api_util import (
     request_looper,
-    request_looper,
-    request_wrapper_async,
     request_looper_async,
+    clear_cache,
+)
+
+# Static endpoints, shared by the sync and async classes
+_EP_PLATFORMS = "/api/v2/referential/platforms"
+_EP_AUDIENCE_PLATFORMS = "/api/v2/referential/platforms/social"
+_EP_STREAMING_PLATFORMS = "/api/v2/referential/platforms/streaming"
+_EP_SONG_CHART_PLATFORMS = "/api/v2/chart/song/platforms"
+_EP_ALBUM_CHART_PLATFORMS = "/api/v2/chart/album/platforms"
+_EP_PLAYLIST_PLATFORMS = "/api/v2/playlist/platforms"
+_EP_RADIO_COUNTRIES = "/api/v2/radio/countries"
+_EP_ARTIST_GENRES = "/api/v2/artist/genres"
+_EP_SONG_GENRES = "/api/v2/referential/song/genres"
+_EP_LABEL_TYPES = "/api/v2/referential/label-types"
+_EP_DISTRIBUTORS = "/api/v2/referential/distributors"
+_EP_LYRICS_ATTRIBUTES = "/api/v2/referential/lyrics-attributes"
+_EP_ARTIST_RANKING_CITIES = "/api/v2/top-artist/referential/cities/"
+
+# Referential data only changes with Soundcharts releases: responses are cached
+_CACHED_ENDPOINTS = (
+    _EP_PLATFORMS,
+    _EP_AUDIENCE_PLATFORMS,
+    _EP_STREAMING_PLATFORMS,
+    _EP_SONG_CHART_PLATFORMS,
+    _EP_ALBUM_CHART_PLATFORMS,
+    _EP_PLAYLIST_PLATFORMS,
+    _EP_RADIO_COUNTRIES,
+    _EP_ARTIST_GENRES,
+    _EP_SONG_GENRES,
+    _EP_LABEL_TYPES,
+    _EP_DISTRIBUTORS,
+    _EP_LYRICS_ATTRIBUTES,
+    _EP_ARTIST_RANKING_CITIES,
 )
 
 
 class Referential:
 
+    @staticmethod
+    def cache_clear():
+        """
+        Drop the cached referential responses, so that the next calls fetch them again.
+        """
+        clear_cache(_CACHED_ENDPOINTS)
+
     @staticmethod
     def get_platforms(offset=0, limit=100):
         """
@@ -16,9 +54,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/platforms"
+        endpoint = _EP_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -29,9 +67,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/platforms/social"
+        endpoint = _EP_AUDIENCE_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -42,9 +80,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/platforms/streaming"
+        endpoint = _EP_STREAMING_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -55,9 +93,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/chart/song/platforms"
+        endpoint = _EP_SONG_CHART_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -68,9 +106,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/chart/album/platforms"
+        endpoint = _EP_ALBUM_CHART_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -81,9 +119,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/playlist/platforms"
+        endpoint = _EP_PLAYLIST_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -94,9 +132,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/radio/countries"
+        endpoint = _EP_RADIO_COUNTRIES
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -107,9 +145,9 @@ class Referential:
         :param sort_order: Sort order. Available values are : asc, desc.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/artist/genres"
+        endpoint = _EP_ARTIST_GENRES
         params = {"genre": genre, "sortOrder": sort_order}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -124,9 +162,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/top-artist/referential/cities/{country_code}"
+        endpoint = f"{_EP_ARTIST_RANKING_CITIES}{country_code}"
         params = {"searchCity": search_city, "offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -138,9 +176,9 @@ class Referential:
         :param sort_order: Sort order. Available values are : asc, desc.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/song/genres"
+        endpoint = _EP_SONG_GENRES
         params = {"genre": genre, "sortOrder": sort_order}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -152,9 +190,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/label-types"
+        endpoint = _EP_LABEL_TYPES
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -166,9 +204,9 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/distributors"
+        endpoint = _EP_DISTRIBUTORS
         params = {"offset": offset, "limit": limit}
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -181,19 +219,26 @@ class Referential:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/lyrics-attributes"
+        endpoint = _EP_LYRICS_ATTRIBUTES
         params = {
             "attribute": attribute,
             "term": term,
             "offset": offset,
             "limit": limit,
         }
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, cache=True)
         return result if result is not None else {}
 
 
 class ReferentialAsync:
 
+    @staticmethod
+    def cache_clear():
+        """
+        Drop the cached referential responses, so that the next calls fetch them again.
+        """
+        clear_cache(_CACHED_ENDPOINTS)
+
     @staticmethod
     async def get_platforms(offset=0, limit=100):
         """
@@ -202,9 +247,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/platforms"
+        endpoint = _EP_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -215,9 +260,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/platforms/social"
+        endpoint = _EP_AUDIENCE_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -228,9 +273,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/platforms/streaming"
+        endpoint = _EP_STREAMING_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -241,9 +286,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/chart/song/platforms"
+        endpoint = _EP_SONG_CHART_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -254,9 +299,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/chart/album/platforms"
+        endpoint = _EP_ALBUM_CHART_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -267,9 +312,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/playlist/platforms"
+        endpoint = _EP_PLAYLIST_PLATFORMS
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -280,9 +325,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/radio/countries"
+        endpoint = _EP_RADIO_COUNTRIES
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -293,9 +338,9 @@ class ReferentialAsync:
         :param sort_order: Sort order. Available values are : asc, desc.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/artist/genres"
+        endpoint = _EP_ARTIST_GENRES
         params = {"genre": genre, "sortOrder": sort_order}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -310,9 +355,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = f"/api/v2/top-artist/referential/cities/{country_code}"
+        endpoint = f"{_EP_ARTIST_RANKING_CITIES}{country_code}"
         params = {"searchCity": search_city, "offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -324,9 +369,9 @@ class ReferentialAsync:
         :param sort_order: Sort order. Available values are : asc, desc.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/song/genres"
+        endpoint = _EP_SONG_GENRES
         params = {"genre": genre, "sortOrder": sort_order}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -338,9 +383,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/label-types"
+        endpoint = _EP_LABEL_TYPES
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -352,9 +397,9 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/distributors"
+        endpoint = _EP_DISTRIBUTORS
         params = {"offset": offset, "limit": limit}
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -367,12 +412,12 @@ class ReferentialAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :return: JSON response or an empty dictionary.
         """
-        endpoint = "/api/v2/referential/lyrics-attributes"
+        endpoint = _EP_LYRICS_ATTRIBUTES
         params = {
             "attribute": attribute,
             "term": term,
             "offset": offset,
             "limit": limit,
         }
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(endpoint, params, cache=True)
         return result if result is not None else {}
@@ -1,8 +1,12 @@
+from functools import partial
 from .api_util import (
     request_wrapper,
     request_wrapper_async,
 )
 
+# The search endpoints return at most this many results per call
+SEARCH_LIMIT_MAX = 20
+
 
 def search_by_type(search_type, term, offset=0, limit=20):
     """
@@ -14,7 +18,9 @@ def search_by_type(search_type, term, offset=0, limit=20):
     :param limit: Number of results to retrieve (max 20).
     :return: JSON response or an empty dictionary.
     """
-    params = {"offset": offset, "limit": min(limit, 20)}
+    if limit > SEARCH_LIMIT_MAX:
+        limit = SEARCH_LIMIT_MAX
+    params = {"offset": offset, "limit": limit}
     endpoint = f"/api/v2/{search_type}/search/{term}"
     result = request_wrapper(endpoint, params)
     return result if result is not None else {}
@@ -30,7 +36,9 @@ async def search_by_type_async(search_type, term, offset=0, limit=20):
     :param limit: Number of results to retrieve (max 20).
     :return: JSON response or an empty dictionary.
     """
-    params = {"offset": offset, "limit": min(limit, 20)}
+    if limit > SEARCH_LIMIT_MAX:
+        limit = SEARCH_LIMIT_MAX
+    params = {"offset": offset, "limit": limit}
     endpoint = f"/api/v2/{search_type}/search/{term}"
     result = await request_wrapper_async(endpoint, params)
     return result if result is not None else {}
@@ -38,30 +46,13 @@ async def search_by_type_async(search_type, term, offset=0, limit=20):
 
 class Search:
 
-    # Specific search functions
-    @staticmethod
-    def search_artist_by_name(term, offset=0, limit=20):
-        return search_by_type("artist", term, offset, limit)
-
-    @staticmethod
-    def search_song_by_name(term, offset=0, limit=20):
-        return search_by_type("song", term, offset, limit)
-
-    @staticmethod
-    def search_playlist_by_name(term, offset=0, limit=20):
-        return search_by_type("playlist", term, offset, limit)
-
-    @staticmethod
-    def search_radio_by_name(term, offset=0, limit=20):
-        return search_by_type("radio", term, offset, limit)
-
-    @staticmethod
-    def search_festival_by_name(term, offset=0, limit=20):
-        return search_by_type("festival", term, offset, limit)
-
-    @staticmethod
-    def search_venue_by_name(term, offset=0, limit=20):
-        return search_by_type("venue", term, offset, limit)
+    # Specific search functions: (term, offset=0, limit=20)
+    search_artist_by_name = staticmethod(partial(search_by_type, "artist"))
+    search_song_by_name = staticmethod(partial(search_by_type, "song"))
+    search_playlist_by_name = staticmethod(partial(search_by_type, "playlist"))
+    search_radio_by_name = staticmethod(partial(search_by_type, "radio"))
+    search_festival_by_name = staticmethod(partial(search_by_type, "festival"))
+    search_venue_by_name = staticmethod(partial(search_by_type, "venue"))
 
     @staticmethod
     def get_soundcharts_url_from_platform_url(platform_url):
@@ -80,30 +71,13 @@ class Search:
 
 class SearchAsync:
 
-    # Specific search functions
-    @staticmethod
-    async def search_artist_by_name(term, offset=0, limit=20):
-        return await search_by_type_async("artist", term, offset, limit)
-
-    @staticmethod
-    async def search_song_by_name(term, offset=0, limit=20):
-        return await search_by_type_async("song", term, offset, limit)
-
-    @staticmethod
-    async def search_playlist_by_name(term, offset=0, limit=20):
-        return await search_by_type_async("playlist", term, offset, limit)
-
-    @staticmethod
-    async def search_radio_by_name(term, offset=0, limit=20):
-        return await search_by_type_async("radio", term, offset, limit)
-
-    @staticmethod
-    async def search_festival_by_name(term, offset=0, limit=20):
-        return await search_by_type_async("festival", term, offset, limit)
-
-    @staticmethod
-    async def search_venue_by_name(term, offset=0, limit=20):
-        return await search_by_type_async("venue", term, offset, limit)
+    # Specific search functions: (term, offset=0, limit=20)
+    search_artist_by_name = staticmethod(partial(search_by_type_async, "artist"))
+    search_song_by_name = staticmethod(partial(search_by_type_async, "song"))
+    search_playlist_by_name = staticmethod(partial(search_by_type_async, "playlist"))
+    search_radio_by_name = staticmethod(partial(search_by_type_async, "radio"))
+    search_festival_by_name = staticmethod(partial(search_by_type_async, "festival"))
+    search_venue_by_name = staticmethod(partial(search_by_type_async, "venue"))
 
     @staticmethod
     async def get_soundcharts_url_from_platform_url(platform_url):
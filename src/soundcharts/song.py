@@ -3,35 +3,64 @@ from .api_util import (
     request_looper,
     request_wrapper_async,
     request_looper_async,
+    request_looper_iter,
+    request_looper_iter_async,
     sort_items_by_date,
+    is_past_date,
+    clear_cache,
+    map_concurrent,
+    map_concurrent_async,
 )
 
+# Lookups by immutable IDs are cached: these are the prefixes of their endpoints
+_CACHED_ENDPOINTS = ("/api/v2.25/song/", "/api/v2/song/")
+
+# Default get_songs payload (descending spotify streams, no filters). Shared by
+# every call: it is only serialized, never modified.
+_DEFAULT_SONGS_BODY = {
+    "sort": {
+        "platform": "spotify",
+        "metricType": "streams",
+        "period": "month",
+        "sortBy": "total",
+        "order": "desc",
+    },
+    "filters": [],
+}
+
 
 class Song:
     @staticmethod
-    def get_songs(offset=0, limit=100, body=None, print_progress=False):
+    def cache_clear():
+        """
+        Drop the cached song responses, so that the next calls fetch them again.
+        """
+        clear_cache(_CACHED_ENDPOINTS)
+
+    @staticmethod
+    def get_songs(
+        offset=0,
+        limit=100,
+        body=None,
+        print_progress=False,
+        max_parallel_requests=None,
+        stream=False,
+    ):
         """
         You can sort songs in our database using specific parameters such as platform, metric type, or time period, and filter them based on attributes like artist nationality, ISRC country, song genre, release date, attributes from lyrics analysis, etc. or performance metrics.
         Available platfom/metricType combinations can be found in the documentation: https://developers.soundcharts.com/documentation/reference/song/get-songs
 
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (descending spotify streams) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return a generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Default: False.
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
-            body = {
-                "sort": {
-                    "platform": "spotify",
-                    "metricType": "streams",
-                    "period": "month",
-                    "sortBy": "total",
-                    "order": "desc",
-                },
-                "filters": [],
-            }
+        if body is None:
+            body = _DEFAULT_SONGS_BODY
 
         endpoint = f"/api/v2/top/songs"
         params = {
@@ -39,7 +68,17 @@ class Song:
             "limit": limit,
         }
 
-        result = request_looper(endpoint, params, body, print_progress=print_progress)
+        if stream:
+            return request_looper_iter(
+                endpoint, params, body, max_parallel_requests=max_parallel_requests
+            )
+        result = request_looper(
+            endpoint,
+            params,
+            body,
+            print_progress=print_progress,
+            max_parallel_requests=max_parallel_requests,
+        )
         return result if result is not None else {}
 
     @staticmethod
@@ -52,9 +91,22 @@ class Song:
         """
 
         endpoint = f"/api/v2.25/song/{song_uuid}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
+    @staticmethod
+    def get_songs_metadata(song_uuids, max_parallel_requests=None):
+        """
+        Get the metadata of several songs at once, sending the requests concurrently.
+
+        :param song_uuids: A list of song UUIDs.
+        :param max_parallel_requests: Maximum number of requests in flight. Default: the client's parallel_requests.
+        :return: Dictionary mapping each song UUID to its JSON response or an empty dictionary.
+        """
+        return map_concurrent(
+            SongAsync.get_song_metadata, song_uuids, max_parallel_requests
+        )
+
     @staticmethod
     def get_song_by_isrc(isrc):
         """
@@ -65,9 +117,20 @@ class Song:
         """
 
         endpoint = f"/api/v2.25/song/by-isrc/{isrc}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
+    @staticmethod
+    def get_songs_by_isrcs(isrcs, max_parallel_requests=None):
+        """
+        Get Soundcharts’ UUIDs & the metadata of several songs at once, sending the requests concurrently.
+
+        :param isrcs: A list of ISRC codes.
+        :param max_parallel_requests: Maximum number of requests in flight. Default: the client's parallel_requests.
+        :return: Dictionary mapping each ISRC to its JSON response or an empty dictionary.
+        """
+        return map_concurrent(SongAsync.get_song_by_isrc, isrcs, max_parallel_requests)
+
     @staticmethod
     def get_song_by_platform_id(platform, identifier):
         """
@@ -79,7 +142,7 @@ class Song:
         """
 
         endpoint = f"/api/v2.25/song/by-platform/{platform}/{identifier}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -92,7 +155,7 @@ class Song:
         """
 
         endpoint = f"/api/v2/song/{song_uuid}/lyrics-analysis"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -181,7 +244,7 @@ class Song:
             "offset": offset,
             "limit": limit,
         }
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, persist=is_past_date(end_date))
         return {} if result is None else sort_items_by_date(result, True)
 
     @staticmethod
@@ -211,7 +274,7 @@ class Song:
             "offset": offset,
             "limit": limit,
         }
-        result = request_looper(endpoint, params)
+        result = request_looper(endpoint, params, persist=is_past_date(end_date))
         return {} if result is None else sort_items_by_date(result, True)
 
     @staticmethod
@@ -223,6 +286,8 @@ class Song:
         limit=100,
         sort_by="position",
         sort_order="asc",
+        max_parallel_requests=None,
+        stream=False,
     ):
         """
         Get current/past chart entries for a specific song.
@@ -234,6 +299,8 @@ class Song:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :param sort_by: Sort criteria. Available values are : position, rankDate. Default: position.
         :param sort_order: Sort order. Available values are : asc, desc. Default: asc
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return a generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Default: False.
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2/song/{song_uuid}/charts/ranks/{platform}"
@@ -244,7 +311,13 @@ class Song:
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
-        result = request_looper(endpoint, params)
+        if stream:
+            return request_looper_iter(
+                endpoint, params, max_parallel_requests=max_parallel_requests
+            )
+        result = request_looper(
+            endpoint, params, max_parallel_requests=max_parallel_requests
+        )
         return result if result is not None else {}
 
     @staticmethod
@@ -259,6 +332,8 @@ class Song:
         limit=100,
         sort_by="entryDate",
         sort_order="desc",
+        max_parallel_requests=None,
+        stream=False,
     ):
         """
         Get current playlist entries for a specific song.
@@ -273,6 +348,8 @@ class Song:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :param sort_by: Sort criteria. Available values are : position, positionDate, entryDate, subscriberCount.
         :param sort_order: Sort order. Available values are : asc, desc. Default: asc
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return a generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Default: False.
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2.20/song/{song_uuid}/playlist/current/{platform}"
@@ -286,7 +363,13 @@ class Song:
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
-        result = request_looper(endpoint, params)
+        if stream:
+            return request_looper_iter(
+                endpoint, params, max_parallel_requests=max_parallel_requests
+            )
+        result = request_looper(
+            endpoint, params, max_parallel_requests=max_parallel_requests
+        )
         return result if result is not None else {}
 
     @staticmethod
@@ -332,6 +415,8 @@ class Song:
         end_date=None,
         offset=0,
         limit=100,
+        max_parallel_requests=None,
+        stream=False,
     ):
         """
         Get radio spins for all tracks of a specific song.
@@ -343,6 +428,8 @@ class Song:
         :param end_date: Optional period end date (format YYYY-MM-DD), leave empty for the latest results.
         :param offset: Pagination offset. Default: 0.
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return a generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Items come in the API's order. Default: False.
         :return: JSON response or an empty dictionary.
         """
 
@@ -355,7 +442,16 @@ class Song:
             "offset": offset,
             "limit": limit,
         }
-        result = request_looper(endpoint, params)
+        if stream:
+            return request_looper_iter(
+                endpoint, params, max_parallel_requests=max_parallel_requests
+            )
+        result = request_looper(
+            endpoint,
+            params,
+            max_parallel_requests=max_parallel_requests,
+            persist=is_past_date(end_date),
+        )
         return {} if result is None else sort_items_by_date(result, key="airedAt")
 
     @staticmethod
@@ -412,29 +508,36 @@ class Song:
 
 class SongAsync:
     @staticmethod
-    async def get_songs(offset=0, limit=100, body=None, print_progress=False):
+    def cache_clear():
+        """
+        Drop the cached song responses, so that the next calls fetch them again.
+        """
+        clear_cache(_CACHED_ENDPOINTS)
+
+    @staticmethod
+    async def get_songs(
+        offset=0,
+        limit=100,
+        body=None,
+        print_progress=False,
+        max_parallel_requests=None,
+        stream=False,
+    ):
         """
         You can sort songs in our database using specific parameters such as platform, metric type, or time period, and filter them based on attributes like artist nationality, ISRC country, song genre, release date, attributes from lyrics analysis, etc. or performance metrics.
         Available platfom/metricType combinations can be found in the documentation: https://developers.soundcharts.com/documentation/reference/song/get-songs
 
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (descending spotify streams) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return an async generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Default: False.
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
-            body = {
-                "sort": {
-                    "platform": "spotify",
-                    "metricType": "streams",
-                    "period": "month",
-                    "sortBy": "total",
-                    "order": "desc",
-                },
-                "filters": [],
-            }
+        if body is None:
+            body = _DEFAULT_SONGS_BODY
 
         endpoint = f"/api/v2/top/songs"
         params = {
@@ -442,8 +545,16 @@ class SongAsync:
             "limit": limit,
         }
 
+        if stream:
+            return request_looper_iter_async(
+                endpoint, params, body, max_parallel_requests=max_parallel_requests
+            )
         result = await request_looper_async(
-            endpoint, params, body, print_progress=print_progress
+            endpoint,
+            params,
+            body,
+            print_progress=print_progress,
+            max_parallel_requests=max_parallel_requests,
         )
         return result if result is not None else {}
 
@@ -457,9 +568,22 @@ class SongAsync:
         """
 
         endpoint = f"/api/v2.25/song/{song_uuid}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
+    @staticmethod
+    async def get_songs_metadata(song_uuids, max_parallel_requests=None):
+        """
+        Get the metadata of several songs at once, sending the requests concurrently.
+
+        :param song_uuids: A list of song UUIDs.
+        :param max_parallel_requests: Maximum number of requests in flight. Default: the client's parallel_requests.
+        :return: Dictionary mapping each song UUID to its JSON response or an empty dictionary.
+        """
+        return await map_concurrent_async(
+            SongAsync.get_song_metadata, song_uuids, max_parallel_requests
+        )
+
     @staticmethod
     async def get_song_by_isrc(isrc):
         """
@@ -470,9 +594,22 @@ class SongAsync:
         """
 
         endpoint = f"/api/v2.25/song/by-isrc/{isrc}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
+    @staticmethod
+    async def get_songs_by_isrcs(isrcs, max_parallel_requests=None):
+        """
+        Get Soundcharts’ UUIDs & the metadata of several songs at once, sending the requests concurrently.
+
+        :param isrcs: A list of ISRC codes.
+        :param max_parallel_requests: Maximum number of requests in flight. Default: the client's parallel_requests.
+        :return: Dictionary mapping each ISRC to its JSON response or an empty dictionary.
+        """
+        return await map_concurrent_async(
+            SongAsync.get_song_by_isrc, isrcs, max_parallel_requests
+        )
+
     @staticmethod
     async def get_song_by_platform_id(platform, identifier):
         """
@@ -484,7 +621,7 @@ class SongAsync:
         """
 
         endpoint = f"/api/v2.25/song/by-platform/{platform}/{identifier}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -497,7 +634,7 @@ class SongAsync:
         """
 
         endpoint = f"/api/v2/song/{song_uuid}/lyrics-analysis"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -588,7 +725,9 @@ class SongAsync:
             "offset": offset,
             "limit": limit,
         }
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(
+            endpoint, params, persist=is_past_date(end_date)
+        )
         return {} if result is None else sort_items_by_date(result, True)
 
     @staticmethod
@@ -618,7 +757,9 @@ class SongAsync:
             "offset": offset,
             "limit": limit,
         }
-        result = await request_looper_async(endpoint, params)
+        result = await request_looper_async(
+            endpoint, params, persist=is_past_date(end_date)
+        )
         return {} if result is None else sort_items_by_date(result, True)
 
     @staticmethod
@@ -630,6 +771,8 @@ class SongAsync:
         limit=100,
         sort_by="position",
         sort_order="asc",
+        max_parallel_requests=None,
+        stream=False,
     ):
         """
         Get current/past chart entries for a specific song.
@@ -641,6 +784,8 @@ class SongAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :param sort_by: Sort criteria. Available values are : position, rankDate. Default: position.
         :param sort_order: Sort order. Available values are : asc, desc. Default: asc
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return an async generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Default: False.
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2/song/{song_uuid}/charts/ranks/{platform}"
@@ -651,7 +796,13 @@ class SongAsync:
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
-        result = await request_looper_async(endpoint, params)
+        if stream:
+            return request_looper_iter_async(
+                endpoint, params, max_parallel_requests=max_parallel_requests
+            )
+        result = await request_looper_async(
+            endpoint, params, max_parallel_requests=max_parallel_requests
+        )
         return result if result is not None else {}
 
     @staticmethod
@@ -666,6 +817,8 @@ class SongAsync:
         limit=100,
         sort_by="entryDate",
         sort_order="desc",
+        max_parallel_requests=None,
+        stream=False,
     ):
         """
         Get current playlist entries for a specific song.
@@ -680,6 +833,8 @@ class SongAsync:
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
         :param sort_by: Sort criteria. Available values are : position, positionDate, entryDate, subscriberCount.
         :param sort_order: Sort order. Available values are : asc, desc. Default: asc
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return an async generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Default: False.
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2.20/song/{song_uuid}/playlist/current/{platform}"
@@ -693,7 +848,13 @@ class SongAsync:
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
-        result = await request_looper_async(endpoint, params)
+        if stream:
+            return request_looper_iter_async(
+                endpoint, params, max_parallel_requests=max_parallel_requests
+            )
+        result = await request_looper_async(
+            endpoint, params, max_parallel_requests=max_parallel_requests
+        )
         return result if result is not None else {}
 
     @staticmethod
@@ -739,6 +900,8 @@ class SongAsync:
         end_date=None,
         offset=0,
         limit=100,
+        max_parallel_requests=None,
+        stream=False,
     ):
         """
         Get radio spins for all tracks of a specific song.
@@ -750,6 +913,8 @@ class SongAsync:
         :param end_date: Optional period end date (format YYYY-MM-DD), leave empty for the latest results.
         :param offset: Pagination offset. Default: 0.
         :param limit: Number of results to retrieve. None: no limit. Default: 100.
+        :param max_parallel_requests: Maximum number of pages fetched concurrently. Default: the client's parallel_requests.
+        :param stream: Return an async generator over the items instead, which fetches the pages as it is consumed: only a few pages are held in memory instead of the whole result. Items come in the API's order. Default: False.
         :return: JSON response or an empty dictionary.
         """
 
@@ -762,7 +927,16 @@ class SongAsync:
             "offset": offset,
             "limit": limit,
         }
-        result = await request_looper_async(endpoint, params)
+        if stream:
+            return request_looper_iter_async(
+                endpoint, params, max_parallel_requests=max_parallel_requests
+            )
+        result = await request_looper_async(
+            endpoint,
+            params,
+            max_parallel_requests=max_parallel_requests,
+            persist=is_past_date(end_date),
+        )
         return {} if result is None else sort_items_by_date(result, key="airedAt")
 
     @staticmethod
@@ -4,11 +4,24 @@ from .api_util import (
     request_wrapper_async,
     request_looper_async,
     sort_items_by_date,
+    clear_cache,
+    map_concurrent,
+    map_concurrent_async,
 )
 
+# Lookups by immutable IDs are cached: these are the prefixes of their endpoints
+_CACHED_ENDPOINTS = ("/api/v2/venue/",)
+
 
 class Venue:
 
+    @staticmethod
+    def cache_clear():
+        """
+        Drop the cached venue responses, so that the next calls fetch them again.
+        """
+        clear_cache(_CACHED_ENDPOINTS)
+
     @staticmethod
     def get_venues(
         offset=0,
@@ -23,13 +36,13 @@ class Venue:
         You'll find available platfom/metricType combinations in the documentation: https://developers.soundcharts.com/documentation/reference/venue/get-venues
 
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (descending soundcharts score) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
+        if body is None:
             platform, metric_type = "soundcharts", "score"
 
             body = {
@@ -61,9 +74,22 @@ class Venue:
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2/venue/{venue_uuid}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
+    @staticmethod
+    def get_venues_metadata(venue_uuids, max_parallel_requests=None):
+        """
+        Get the metadata of several venues at once, sending the requests concurrently.
+
+        :param venue_uuids: A list of venue UUIDs.
+        :param max_parallel_requests: Maximum number of requests in flight. Default: the client's parallel_requests.
+        :return: Dictionary mapping each venue UUID to its JSON response or an empty dictionary.
+        """
+        return map_concurrent(
+            VenueAsync.get_venue_metadata, venue_uuids, max_parallel_requests
+        )
+
     @staticmethod
     def get_venue_by_platform_id(platform, identifier):
         """
@@ -75,7 +101,7 @@ class Venue:
         """
 
         endpoint = f"/api/v2/venue/by-platform/{platform}/{identifier}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -127,12 +153,19 @@ class Venue:
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2/venue/concert/{concert_uuid}"
-        result = request_wrapper(endpoint)
+        result = request_wrapper(endpoint, cache=True)
         return result if result is not None else {}
 
 
 class VenueAsync:
 
+    @staticmethod
+    def cache_clear():
+        """
+        Drop the cached venue responses, so that the next calls fetch them again.
+        """
+        clear_cache(_CACHED_ENDPOINTS)
+
     @staticmethod
     async def get_venues(
         offset=0,
@@ -147,13 +180,13 @@ class VenueAsync:
         You'll find available platfom/metricType combinations in the documentation: https://developers.soundcharts.com/documentation/reference/venue/get-venues
 
         :param offset: Pagination offset. Default: 0.
-        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls - you may want to use parallel processing). Default: 100.
+        :param limit: Number of results to retrieve. None: no limit (warning: can take thousands of calls, sent concurrently: see the client's parallel_requests). Default: 100.
         :param body: JSON Payload. If none, the default sorting will apply (descending soundcharts score) and there will be no filters.
         :param print_progress: Prints an estimated progress percentage (default: False).
         :return: JSON response or an empty dictionary.
         """
 
-        if body == None:
+        if body is None:
             platform, metric_type = "soundcharts", "score"
 
             body = {
@@ -187,9 +220,22 @@ class VenueAsync:
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2/venue/{venue_uuid}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
+    @staticmethod
+    async def get_venues_metadata(venue_uuids, max_parallel_requests=None):
+        """
+        Get the metadata of several venues at once, sending the requests concurrently.
+
+        :param venue_uuids: A list of venue UUIDs.
+        :param max_parallel_requests: Maximum number of requests in flight. Default: the client's parallel_requests.
+        :return: Dictionary mapping each venue UUID to its JSON response or an empty dictionary.
+        """
+        return await map_concurrent_async(
+            VenueAsync.get_venue_metadata, venue_uuids, max_parallel_requests
+        )
+
     @staticmethod
     async def get_venue_by_platform_id(platform, identifier):
         """
@@ -201,7 +247,7 @@ class VenueAsync:
         """
 
         endpoint = f"/api/v2/venue/by-platform/{platform}/{identifier}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}
 
     @staticmethod
@@ -255,5 +301,5 @@ class VenueAsync:
         :return: JSON response or an empty dictionary.
         """
         endpoint = f"/api/v2/venue/concert/{concert_uuid}"
-        result = await request_wrapper_async(endpoint)
+        result = await request_wrapper_async(endpoint, cache=True)
         return result if result is not None else {}